@@ -3,17 +3,332 @@
 __version__ = "0.5.1"
 
 import os
-import yaml
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import urllib
 import time
 from typing import Union
 import io
 import logging
-import copy
 import re
-import inspect
+import threading
+import concurrent.futures
+import collections
+import asyncio
+import math
+import urllib.parse
+import copy
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # orjson is optional, stdlib json accepts bytes as well
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, only needed to stream responses
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is optional, only needed for http2=True
+    httpx = None
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache is optional, only needed for use_cache=True
+    requests_cache = None
+
+# attributes of a match confirm/reject response which are not returned
+_SKIP_KEYS = frozenset(("raw_data", "row_index", "source"))
+_SKIP_PREFIXES = ("ppe_", "processing_", "clean_")
+
+# facility detail properties which are not returned
+_FACILITY_SKIP_KEYS = frozenset(("new_os_id",))
+_FACILITY_BASIC_SKIP_KEYS = _FACILITY_SKIP_KEYS | {"extended_fields"}
+_FACILITY_SKIP_PREFIXES = ("ppe_",)
+# extended fields of a match are returned as "match_ef_<field>" instead of "match_extended_fields_<field>"
+_EF_PREFIX = "match_ef_"
+# per field settings of an embedded map, flattened into "<column_name>_<setting>" keys
+_EMBED_COLUMNS = ("display_name", "visible", "order", "searchable")
+
+# facility uploads are form encoded, as recorded in the test cassettes, once per record
+_FORM_CONTENT_TYPE = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# bulk upload cleansing: a run of commas, possibly with blanks in between, becomes one comma
+_CLEANSE_RE = re.compile(r",(?:\s*,)+")
+
+# wait time in a throttled (429) response, e.g. "Request was throttled. Expected available in 5 seconds."
+_RATE_LIMIT_RE = re.compile(r"in (\d+) seconds?")
+
+# Workers range texts look like "1001-5000", "Less than 1000" or "More than 10000"
+_WORKERS_RANGE_RE = re.compile(r"^\s*(?:(\d+)\s*-\s*(\d+)|Less\D*(\d+)|More\D*(\d+))\s*$")
+
+# The count endpoints answer {"count": N}, the number is read straight from the body
+_COUNT_RE = re.compile(rb'"count"\s*:\s*(-?\d+)')
+
+# Reference data (countries, sectors, ...) hardly ever changes, so it is kept for an hour
+_METADATA_TTL = 3600
+
+# Contributors and their lists change slowly, counts change all the time but are rarely needed to the minute
+_CONTRIBUTORS_TTL = 600
+_CONTRIBUTOR_LISTS_TTL = 300
+_COUNT_TTL = 60
+
+_YAML_CACHE = collections.OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+def _yaml_load(stream) -> dict:
+    """Parse yaml, PyYAML is only imported once credentials are actually read from yaml.
+
+    Internal use only.
+    """
+    import yaml
+    # libyaml backed loader if available, credential files only need the safe subset of yaml
+    return yaml.load(stream, getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _rows_to_dataframe(headers: list, rows: list):
+    """Build a pandas DataFrame from the server's headers and rows, pandas is only imported when a frame is
+    actually requested.
+
+    Internal use only.
+    """
+    import pandas
+    return pandas.DataFrame(rows, columns=headers)
+
+
+def _load_yaml_cached(path: str) -> dict:
+    """Load a yaml file, reusing the parsed content as long as the file's mtime and size are unchanged.
+
+    Internal use only.
+    """
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if key in _YAML_CACHE and _YAML_CACHE[key][0] == signature:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(_YAML_CACHE[key][1])
+
+    with open(path, "rt") as f:
+        content = _yaml_load(f)
+    _YAML_CACHE[key] = (signature, content)
+    _YAML_CACHE.move_to_end(key)
+    while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(content)
+
+
+def _ijson_items(stream, item_prefix: str, fields: dict):
+    """Incrementally parse a JSON document, yielding the values found at ``item_prefix``
+    (an `ijson <https://pypi.org/project/ijson/>`_ prefix such as ``features.item``).
+
+    Values found at any of the prefixes given as keys of ``fields`` are stored in ``fields``.
+
+    Internal use only, requires ijson.
+    """
+    builder = None
+    builder_prefix = ""
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == builder_prefix and event in ("end_map", "end_array"):
+                if builder_prefix == item_prefix:
+                    yield builder.value
+                else:
+                    fields[builder_prefix] = builder.value
+                builder = None
+        elif (prefix == item_prefix or prefix in fields) and event != "map_key":
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder_prefix = prefix
+                builder.event(event, value)
+            elif prefix == item_prefix:
+                yield value
+            else:
+                fields[prefix] = value
+
+
+def _page_urls(next_url: str, count, page_size: int) -> list:
+    """Return the URLs of all pages from ``next_url`` on, derived from its ``page`` or ``offset`` query
+    parameter, or an empty list if they can't be derived.
+    """
+    if not count or page_size <= 0:
+        return []
+    parts = urllib.parse.urlsplit(next_url)
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    values = dict(query)
+    try:
+        if "page" in values:
+            key, positions = "page", range(int(values["page"]), math.ceil(count/page_size)+1)
+        elif "offset" in values:
+            key, positions = "offset", range(int(values["offset"]), count, int(values.get("limit", page_size)))
+        else:
+            return []
+    except (TypeError, ValueError):  # count or position not a number
+        return []
+    return [
+        urllib.parse.urlunsplit(parts._replace(
+            query=urllib.parse.urlencode([(k, position if k == key else v) for k, v in query])))
+        for position in positions
+    ]
+
+
+def _row_to_text(row: dict) -> str:
+    """Join a dictionary to one ``key:value|key:value`` line, with ``lng`` renamed to ``lon``."""
+    return "|".join([f"lon:{v}" if k == "lng" else f"{k}:{v}" for k, v in row.items()])
+
+
+def _rows_to_text(rows: list) -> str:
+    """Join a list of dictionaries to text, one ``key:value|key:value`` line per dictionary, with ``lng``
+    renamed to ``lon``."""
+    return "\n".join([_row_to_text(row) for row in rows])
+
+
+def _flatten_matched_facility(new_data: dict, matched_facility: dict):
+    """Add the attributes of a matched facility with a ``matched_`` prefix, the location as lat/lon."""
+    for k, v in matched_facility.items():
+        if k == "location":
+            new_data["matched_lat"] = v["lat"]
+            new_data["matched_lon"] = v["lng"]
+        elif k != "created_from_id":
+            new_data[f"matched_{k}"] = v
+
+
+def _join_sectors(new_data: dict, sectors: list):
+    """Add the sectors as one ``|`` separated text, an empty one if the API sent none."""
+    new_data["sector"] = "|".join(sectors) if sectors else ""
+
+
+# match confirm/reject response attributes which need more than a copy, everything else is looked up once
+_MATCH_HANDLERS = {
+    "matched_facility": _flatten_matched_facility,
+    "sector": _join_sectors,
+}
+
+
+def _flatten_match_list(new_data: dict, key: str, values: list):
+    """Add a list property of a match as text, one line per entry, dict entries as ``key:value|key:value``."""
+    lines = []
+    for value in values:
+        if isinstance(value, dict):
+            lines.append(_row_to_text(value))
+        elif isinstance(value, str):
+            lines.append(value)
+    new_data["match_" + key] = "\n".join(lines)
+
+
+def _flatten_match_dict(new_data: dict, key: str, values: dict):
+    """Add each entry of a dict property of a match as its own ``match_<property>_<entry>`` text."""
+    # key prefix is built once per property and reused for every sub key
+    prefix = _EF_PREFIX if key == "extended_fields" else f"match_{key}_"
+    for k, v in values.items():
+        if isinstance(v, str):
+            new_data[prefix + k] = v
+            continue
+        for entry in v:
+            if not isinstance(entry, dict):
+                raise NotImplementedError("Internal _flatten_facilities_json. Facilities data structure must have changed. "
+                                          "Instance 2/2. "
+                                          "Please report on github and/or check for an updated library.")
+        new_data[prefix + k] = _rows_to_text(v)
+
+
+# match properties which are flattened further, by exact type of the value, everything else is copied
+_MATCH_PROPERTY_HANDLERS = {
+    list: _flatten_match_list,
+    dict: _flatten_match_dict,
+}
+
+
+class _HttpxRaw():
+    """File like view of a streamed httpx response, as ``requests.Response.raw`` offers it.
+
+    Internal use only.
+    """
+    def __init__(self, response):
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+        self.decode_content = True  # httpx always decodes, kept for interface compatibility
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _HttpxResponse():
+    """Wraps a ``httpx.Response`` to look like a ``requests.Response`` to the rest of the code.
+
+    Internal use only.
+    """
+    def __init__(self, response, stream: bool = False):
+        self._response = response
+        self.status_code = response.status_code
+        self.reason = response.reason_phrase
+        self.ok = response.status_code < 400
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.raw = _HttpxRaw(response) if stream else None
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    @property
+    def text(self) -> str:
+        try:
+            return self._response.text
+        except httpx.ResponseNotRead:  # body was consumed while streaming
+            return ""
+
+    def json(self, **kwargs):
+        return _json_loads(self.content)
+
+    def __repr__(self) -> str:
+        return f"<Response [{self.status_code}]>"
+
+
+class _HttpxSession():
+    """Minimal ``requests.Session`` stand-in on top of ``httpx.Client``, used to talk HTTP/2.
+
+    Internal use only.
+    """
+    def __init__(self, http2: bool = True):
+        self._client = httpx.Client(http2=http2, http1=True,
+                                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                                    timeout=30.0)
+        self.headers = self._client.headers
+
+    def request(self, method: str, url: str, params=None, stream: bool = False, **kwargs) -> _HttpxResponse:
+        if isinstance(kwargs.get("data"), (bytes, str)):  # httpx takes pre-encoded bodies as content=
+            kwargs["content"] = kwargs.pop("data")
+        request = self._client.build_request(method, url, params=params, **kwargs)
+        return _HttpxResponse(self._client.send(request, stream=stream), stream=stream)
+
+    def get(self, url: str, **kwargs) -> _HttpxResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> _HttpxResponse:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self._client.close()
 
 
 class OSH_API():
@@ -31,7 +346,8 @@ class OSH_API():
     """
     def __init__(self, url: str = "http://opensupplyhub.org", token: str = "",
                  path_to_env_yml: str = "", url_to_env_yml: str = "",
-                 check_token: bool = False):
+                 check_token: bool = False, http2: bool = False, check_url: bool = False,
+                 use_cache: bool = False):
         """object generation method
 
         Parameters
@@ -46,19 +362,39 @@ class OSH_API():
             URL from where a text yaml file containing access token and/or endpoint URL can be downloaded
         check_token: bool, optional, default = False
             Whether to check API token validity during initialisation. Note this will cost one API call count.
+        http2: bool, optional, default = False
+            Use `httpx <https://www.python-httpx.org/>`_ to talk HTTP/2 to the endpoint, so paginated requests
+            share a single multiplexed connection. Requires the optional ``httpx[http2]`` package, plain
+            `requests` is used if it is not installed.
+        check_url: bool, optional, default = False
+            Whether to call the endpoint's health check during initialisation. Off by default, so creating an
+            object does not need a network round trip, connectivity errors surface on the first API call anyway.
+        use_cache: bool, optional, default = False
+            Keep GET responses in a local SQLite file, ``.pyoshub_cache.sqlite``, honouring the server's
+            ``Cache-Control`` and ``ETag`` headers, so they are reused across program runs. Cached answers
+            expire after five minutes unless the server says otherwise, and are still returned for up to ten
+            minutes if the endpoint fails. Requires the optional
+            `requests-cache <https://pypi.org/project/requests-cache/>`_ package, and is not available
+            together with ``http2``.
 
         """
         self._header = {}
+        self._session = self._new_session(http2, use_cache)
         credentials = {}
         self._error = False
+        self._last_response = None
+        self._keep_raw = True
+        self._lock = threading.Lock()
+        self._match_cache = {}
+        self._meta_cache = {}
+        self._response_cache = {}
 
         if len(path_to_env_yml) > 0:
             try:
-                with open(path_to_env_yml, "rt") as f:
-                    credentials = yaml.load(f, yaml.Loader)
-                    self._url = credentials["OSH_URL"]
-                    self._token = credentials["OSH_TOKEN"]
-                    logging.info("using specified env file")
+                credentials = _load_yaml_cached(path_to_env_yml)
+                self._url = credentials["OSH_URL"]
+                self._token = credentials["OSH_TOKEN"]
+                logging.info("using specified env file")
             except Exception as e:
                 self._result = {"code": -1, "message": str(e)}
                 self._error = True
@@ -67,15 +403,14 @@ class OSH_API():
         elif len(url_to_env_yml) > 0:
             try:
                 r = requests.get(url_to_env_yml)
-                credentials = yaml.load(io.StringIO(r.text), yaml.Loader)
+                credentials = _yaml_load(io.StringIO(r.text))
                 self._url = credentials["OSH_URL"]
                 self._token = credentials["OSH_TOKEN"]
             except Exception:
                 pass
         elif os.path.exists("./.env.yml"):
             try:
-                with open("./.env.yml", "rt") as f:
-                    credentials = yaml.load(f, yaml.Loader)
+                credentials = _load_yaml_cached("./.env.yml")
                 self._url = credentials["OSH_URL"]
                 self._token = credentials["OSH_TOKEN"]
             except Exception:
@@ -100,11 +435,30 @@ class OSH_API():
             self._token = token
 
         self._url = self._url.strip("/")  # remove trailing slash as we add it
+        self._health_url = f"{self._url}/health-check/"
+        self._facilities_url = f"{self._url}/api/facilities/"
+        self._facilities_count_url = f"{self._url}/api/facilities/count/"
+        self._contributor_types_url = f"{self._url}/api/contributor-types"
+        self._countries_url = f"{self._url}/api/countries"
+        self._countries_active_count_url = f"{self._url}/api/countries/active_count"
+        self._facility_processing_types_url = f"{self._url}/api/facility-processing-types/"
+        self._product_types_url = f"{self._url}/api/product-types/"
+        self._sectors_url = f"{self._url}/api/sectors/"
+        self._workers_ranges_url = f"{self._url}/api/workers-ranges/"
+        self._facility_matches_url = f"{self._url}/api/facility-matches/"
+        self._contributors_url = f"{self._url}/api/contributors"
+        self._contributors_active_count_url = f"{self._url}/api/contributors/active_count"
+        self._contributor_lists_url = f"{self._url}/api/contributor-lists/"
+        self._parent_companies_url = f"{self._url}/api/parent-companies/"
+        self._facilities_downloads_url = f"{self._url}/api/facilities-downloads/"
+        self._contributor_embed_configs_url = f"{self._url}/api/contributor-embed-configs/"
 
         self._header = {
             "accept": "application/json",
             "Authorization": f"Token {self._token}"
         }
+        # set once, so requests made through the session don't need to pass headers
+        self._session.headers.update(self._header)
 
         self._api_call_count = 0
         self.last_api_call_epoch = -1
@@ -113,41 +467,45 @@ class OSH_API():
         self.countries_active_count = -1
         self._facilites_count = -1
         self._contributors = []
-        self._raw_data = ""
+        # when set, cached contributor data and counts are returned, flagged as stale, if the endpoint fails
+        self.cache_fallback_enabled = False
+
+        self._result = {"code": 0, "message": "ok"}
+        self._error = False
 
         # Check valid URL
-        try:
-            r = requests.get(f"{self._url}/health-check/", timeout=5)
-            if r.ok:
-                self._result = {"code": 0, "message": "ok"}
-                self._error = False
-            else:
-                self._result = {"code": r.status_code, "message": r.reason}
-                self._error = False
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
+        if check_url:
+            try:
+                r = self._session.get(self._health_url, timeout=5)
+                if r.ok:
+                    self._result = {"code": 0, "message": "ok"}
+                    self._error = False
+                else:
+                    self._result = {"code": r.status_code, "message": r.reason}
+                    self._error = False
+            except Exception as e:
+                self._result = {"code": -1, "message": str(e)}
+                self._error = True
+                return
 
         # Check header/token validity
         if check_token and len(self._token.strip()) == 0:
             self._result = {"code": -1, "message": "No/empty token"}
             self._error = True
         elif check_token:
-            self._raw_data = ""
+            self._last_response = None
             try:
-                self.last_api_call_epoch = time.time()
-                r = requests.get(f"{self._url}/api/facilities/count/", headers=self._header)
-                self._raw_data = copy.copy(r.text)
-                self.last_api_call_duration = time.time()-self.last_api_call_epoch
-                self._api_call_count += 1
+                epoch, start = time.time(), time.perf_counter_ns()
+                r = self._session.get(self._facilities_count_url)
+                self._set_last_response(r)
+                self._record_call(epoch, start)
                 if not r.ok:
                     self._result = {"code": r.status_code, "message": str(r)}
                     self._error = True
                 else:
                     # Check everything is working
                     try:
-                        data = json.loads(r.text)
+                        data = _json_loads(r.content)
                         self._facilites_count = data["count"]
                         self._result = {"code": 0, "message": "ok"}
                         self._error = False
@@ -162,10 +520,45 @@ class OSH_API():
                 self._facilites_count = -1
                 return
         else:
-            self._raw_data = ""
+            self._last_response = None
 
         return
 
+    @staticmethod
+    def _new_session(http2: bool = False, use_cache: bool = False):
+        """Create the HTTP session, a httpx based one if HTTP/2 was asked for and is available, a caching one
+        if asked for and requests-cache is available.
+
+        Internal use only.
+        """
+        if http2:
+            try:
+                return _HttpxSession(http2=True)
+            except Exception as e:  # httpx or h2 not installed
+                logging.warning(f"HTTP/2 not available, using requests: {e}")
+        if use_cache and requests_cache is None:
+            logging.warning("use_cache=True requires the requests-cache package, responses are not cached")
+        if use_cache and requests_cache is not None:
+            session = requests_cache.CachedSession(cache_name=".pyoshub_cache", backend="sqlite", expire_after=300,
+                                                   cache_control=True, stale_if_error=600)
+        else:
+            session = requests.Session()
+        # keep-alive pool, transient server errors and dropped connections are retried with a short backoff,
+        # POSTs are never retried on a status code as they are not idempotent. Rate limits (429) are not
+        # retried here and Retry-After is ignored: the server puts its whole throttling window in that header,
+        # the wait is bounded by the caller's timeout in post_facilities instead
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504],
+                                                respect_retry_after_header=False, raise_on_status=False))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Close the HTTP session and its pooled connections. The object should not be used afterwards.
+        """
+        self._session.close()
+
     @property
     def api_call_count(self) -> int:
         """The accumulated number of API calls made during the lifetime of the object. This value is not
@@ -181,20 +574,42 @@ class OSH_API():
     @property
     def contributors(self) -> list:
         """Return the list of contributors, if call to get_contributors had been made, or an empty list.
+        The list is in the form the last call returned it, ``(contributor_id, contributor_name)`` tuples after
+        ``get_contributors(flat=True)``.
         """
         return self._contributors
 
+    def keep_raw_data(self, keep: bool = True):
+        """Keep the last response, so its body can be read from :py:attr:`~pyoshub.OSH_API.raw_data`, e.g. for
+        debugging. On by default, ``keep_raw_data(False)`` stops large response bodies, e.g. of
+        :py:meth:`~pyoshub.OSH_API.get_facilities_downloads`, from being held on to after a call.
+        """
+        self._keep_raw = keep
+        if not keep:
+            self._last_response = None
+
+    def _set_last_response(self, r):
+        """Remember a response for :py:attr:`~pyoshub.OSH_API.raw_data`, if asked to.
+
+        Internal use only.
+        """
+        if self._keep_raw:
+            self._last_response = r
+
     @property
     def raw_data(self) -> str:
-        """Return the raw data from the last request made. May be empty in some conditions
+        """Return the raw data from the last request made. Empty if turned off with
+        :py:meth:`~pyoshub.OSH_API.keep_raw_data`, and may be empty in some other conditions.
         """
-        return self._raw_data
+        if self._last_response is None:
+            return ""
+        return self._last_response.text
 
     @property
     def header(self) -> dict:
         """Return the header used to make calls to the API
         """
-        return self._header
+        return dict(self._header)
 
     @property
     def error(self) -> bool:
@@ -256,7 +671,8 @@ class OSH_API():
                        boundary: dict = {}, parent_company: str = "", facility_type: str = "",
                        processing_type: str = "", product_type: str = "", number_of_workers: str = "",
                        native_language_name: str = "", detail: bool = False, sectors: str = "",
-                       page: int = -1, pageSize: int = -1) -> list:
+                       page: int = -1, pageSize: int = -1, stream: bool = False,
+                       return_shape: str = "records") -> Union[list, dict]:
         """Returns a list of facilities in GeoJSON format for a given query. (Maximum of 50 facilities per page if the detail parameter is fale or not specified, 10 if the detail parameter is true.)
 
         .. attention::
@@ -275,7 +691,7 @@ class OSH_API():
            Contributor Type
         countries : str, optional
            Country Code
-        boundary : str, optional
+        boundary : dict, optional
            Pass a GeoJSON geometry to filter by facilities within the boundaries of that geometry.
         parent_company : str, optional
            Pass a Contributor ID or Contributor name to filter by facilities with that Parent Company.
@@ -296,13 +712,26 @@ class OSH_API():
         page : int, optional
            A page number within the paginated result set.
         pageSize : int, optional
-           Number of results to return per page.
+           Number of results to return per page. If not specified, the server uses its maximum
+           page size (50, or 10 with ``detail=True``), so all results are retrieved with the fewest
+           number of requests. Only specify a smaller value if you need to limit the size of
+           individual responses.
+        stream : bool, optional
+           Parse responses incrementally while they are being downloaded, instead of loading each page
+           into memory first. This lowers peak memory use for large responses (e.g. with ``detail=True``),
+           at the cost of slightly higher CPU use and fetching pages strictly one after the other.
+           Requires the optional `ijson <https://pypi.org/project/ijson/>`_ package.
+        return_shape : str, optional, default = "records"
+           ``"records"`` returns a list with one dictionary per facility. ``"columns"`` returns a dictionary
+           of lists, one list per column, padded with ``None`` where a facility lacks a column. The columnar
+           shape needs considerably less memory for large results and converts to a DataFrame with
+           ``pd.DataFrame(result)`` without another pass over every row.
 
         Returns
         -------
-        list(dict)
-            An array of dictionaries (key,value pairs). See table below for
-            return data structures.
+        list(dict) or dict(list)
+            An array of dictionaries (key,value pairs), or a dictionary of columns if
+            ``return_shape="columns"``. See table below for return data structures.
 
             +-------------------------------+-----------------------------------------------+-------+
             |column                         | description                                   | type  |
@@ -388,107 +817,53 @@ class OSH_API():
             | sector                        | Business sector                               | str   |
             +-------------------------------+-----------------------------------------------+-------+
         """
-        parameters = []
-
-        if page != -1:
-            parameters.append(f"page={page}")
-        if pageSize != -1:
-            parameters.append(f"pageSize={pageSize}")
-        if len(q) > 0:
-            q = urllib.parse.quote_plus(q)
-            parameters.append(f"q={q}")
-        if contributors != -1:
-            if isinstance(contributors, list):
-                for contributor in contributors:
-                    c = urllib.parse.quote_plus(str(contributor))
-                    parameters.append(f"contributors={c}")
-            else:
-                contributors = urllib.parse.quote_plus(str(contributors))
-                parameters.append(f"contributors={contributors}")
-        if lists != -1:
-            parameters.append(f"lists={lists}")
-        if len(contributor_types) > 0:
-            if isinstance(contributor_types, list):
-                for contributor_type in contributor_types:
-                    ct = urllib.parse.quote_plus(contributor_type)
-                    parameters.append(f"contributor_types={ct}")
-            else:
-                contributor_types = urllib.parse.quote_plus(contributor_types)
-                parameters.append(f"contributor_types={contributor_types}")
-        if len(countries) > 0:
-            countries = urllib.parse.quote_plus(countries)
-            parameters.append(f"countries={countries}")
-        if len(boundary.keys()) > 0:
-            boundary = urllib.parse.quote_plus(str(boundary).replace(" ", ""))
-            parameters.append(f"boundary={boundary}")
-        if len(parent_company) > 0:
-            parent_company = urllib.parse.quote_plus(parent_company)
-            parameters.append(f"parent_company={parent_company}")
-        if len(facility_type) > 0:
-            facility_type = urllib.parse.quote_plus(facility_type)
-            parameters.append(f"facility_type={facility_type}")
-        if len(processing_type) > 0:
-            processing_type = urllib.parse.quote_plus(processing_type)
-            parameters.append(f"processing_type={processing_type}")
-        if len(product_type) > 0:
-            product_type = urllib.parse.quote_plus(product_type)
-            parameters.append(f"product_type={product_type}")
-        if len(number_of_workers) > 0:
-            number_of_workers = urllib.parse.quote_plus(number_of_workers)
-            parameters.append(f"number_of_workers={number_of_workers}")
-        if len(native_language_name) > 0:
-            native_language_name = urllib.parse.quote_plus(native_language_name)
-            parameters.append(f"native_language_name={native_language_name}")
-        if detail:
-            parameters.append("detail=true")
+        parameters = self._facilities_parameters(
+            q=q, contributors=contributors, lists=lists, contributor_types=contributor_types, countries=countries,
+            boundary=boundary, parent_company=parent_company, facility_type=facility_type,
+            processing_type=processing_type, product_type=product_type, number_of_workers=number_of_workers,
+            native_language_name=native_language_name, detail=detail, sectors=sectors,
+            page=page, pageSize=pageSize)
+
+        if return_shape == "columns":
+            alldata = {}
+            add_features = self._features_to_columns
+        elif return_shape == "records":
+            alldata = []
+            add_features = self._features_to_entries
         else:
-            parameters.append("detail=false")
-        if len(sectors) > 0:
-            sectors = urllib.parse.quote_plus(sectors)
-            parameters.append(f"sectors={sectors}")
-
-        parameters = "&".join(parameters)
-        have_next = True
-        request_url = f"{self._url}/api/facilities/?{parameters}"
-
-        alldata = []
-        self._raw_data = ""
+            self._result = {"code": -1, "message": f"Invalid return_shape '{return_shape}'"}
+            self._error = True
+            return []
+        self._last_response = None
 
-        while have_next:
-            try:
-                self.last_api_call_epoch = time.time()
-                r = requests.get(request_url, headers=self._header)
-                self._raw_data = copy.copy(r.text)
-                self.last_api_call_duration = time.time()-self.last_api_call_epoch
-                self._api_call_count += 1
-                if r.ok:
-                    data = json.loads(r.text)
-
-                    for entry in data["features"]:
-                        new_entry = {
-                            "os_id": entry["id"],
-                            "lon": entry["geometry"]["coordinates"][0],
-                            "lat": entry["geometry"]["coordinates"][1],
-                        }
-                        for k, v in entry["properties"].items():
-                            if not k.startswith("ppe_") and not k == "new_os_id":
-                                new_entry[k] = v
-                        alldata.append(new_entry)
+        if stream:
+            return self._get_facilities_stream(parameters, alldata, add_features)
 
-                    self._result = {"code": 0, "message": f"{r.status_code}"}
-                    if 'next' in data.keys() and data["next"] is not None:
-                        request_url = data["next"]
+        # The next page is requested in the background while the current one is being processed
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(self._get_timed, self._facilities_url, params=parameters)
+            while next_page is not None:
+                try:
+                    r = next_page.result()
+                    next_page = None
+                    self._set_last_response(r)
+                    if r.ok:
+                        data = _json_loads(r.content)
+                        if 'next' in data.keys() and data["next"] is not None:
+                            # the next URL comes with the query already encoded
+                            next_page = executor.submit(self._get_timed, data["next"])
+
+                        add_features(data["features"], alldata)
+
+                        self._result = {"code": 0, "message": f"{r.status_code}"}
+                        self._error = False
                     else:
-                        have_next = False
-                    self._error = False
-                else:
-                    self._result = {"code": -1, "message": f"{r.status_code}"}
-                    have_next = False
+                        self._result = {"code": -1, "message": f"{r.status_code}"}
+                        self._error = True
+                except Exception as e:
+                    self._result = {"code": -1, "message": str(e)}
                     self._error = True
-            except Exception as e:
-                self._result = {"code": -1, "message": str(e)}
-                self._error = True
-                return alldata
+                    return alldata
 
         return alldata
 
@@ -557,7 +932,13 @@ class OSH_API():
             by default {}. If optional parameters are speficied in addition to this parameter, the
             optional parameters will overwrite the ``data`` entries.
         create : bool, optional
-            _description_, by default False
+            Create a new facility if no match is found, by default False.
+
+            .. note::
+              The flags are sent the way earlier releases sent them, as ``/api/facilities/??create=...``.
+              The server reads the first key as ``?create`` and ignores it, so whether a facility is created
+              follows the server's own default, not this parameter. Sending ``create`` correctly changes
+              what uploads do and is left to a separate fix.
         public : bool, optional
             _description_, by default True
         textonlyfallback : bool, optional
@@ -717,62 +1098,40 @@ class OSH_API():
         if len(name) > 0:
             payload["name"] = name.strip()
         elif "name" not in payload.keys():
-            self._result = {"code": -100, "message": "Error: Empty facility name given, we need a name."}
-            self._error = True
-            return {"status": "PYTHON_PARAMETER_ERROR"}
+            return self._fail(-100, "Error: Empty facility name given, we need a name.", "PYTHON_PARAMETER_ERROR")
 
         if len(address) > 0:
             payload["address"] = address.strip()
         elif "address" not in payload.keys():
-            self._result = {"code": -101, "message": "Error: Empty address given, we need an address."}
-            self._error = True
-            return {"status": "PYTHON_PARAMETER_ERROR"}
+            return self._fail(-101, "Error: Empty address given, we need an address.", "PYTHON_PARAMETER_ERROR")
 
         if len(country) > 0:
             payload["country"] = country.strip()
         elif "country" not in payload.keys():
-            self._result = {"code": -102, "message": "Error: Empty country name given, we need a country."}
-            self._error = True
-            return {"status": "PYTHON_PARAMETER_ERROR"}
-
-        if len(sector) > 0:
-            payload["sector"] = sector.strip()
-
-        if len(number_of_workers) > 0:
-            payload["number_of_workers"] = str(number_of_workers).strip()
-
-        if len(facility_type) > 0:
-            payload["facility_type"] = facility_type.strip()
-
-        if len(processing_type) > 0:
-            payload["processing_type"] = processing_type.strip()
-
-        if len(product_type) > 0:
-            payload["product_type"] = product_type.strip()
-
-        if len(parent_company_name) > 0:
-            payload["parent_company_name"] = parent_company_name.strip()
-
-        if len(native_language_name) > 0:
-            payload["native_language_name"] = native_language_name.strip()
-
-        parameters = "?"
-        if create:
-            parameters += "create=true"
-        else:
-            parameters += "create=false"
-
-        if public:
-            parameters += "&public=true"
-        else:
-            parameters += "&public=false"
-
-        if textonlyfallback:
-            parameters += "&textonlyfallback=true"
-        else:
-            parameters += "&textonlyfallback=false"
+            return self._fail(-102, "Error: Empty country name given, we need a country.", "PYTHON_PARAMETER_ERROR")
+
+        optional_fields = (
+            ("sector", sector),
+            ("number_of_workers", str(number_of_workers)),
+            ("facility_type", facility_type),
+            ("processing_type", processing_type),
+            ("product_type", product_type),
+            ("parent_company_name", parent_company_name),
+            ("native_language_name", native_language_name),
+        )
+        payload.update({k: v.strip() for k, v in optional_fields if v})
+
+        parameters = {
+            "create": "true" if create else "false",
+            "public": "true" if public else "false",
+            "textonlyfallback": "true" if textonlyfallback else "false",
+        }
 
-        self._raw_data = ""
+        self._last_response = None
+        try:
+            body = urllib.parse.urlencode(payload).encode()
+        except Exception as e:  # e.g. lone surrogates, which can't be encoded as UTF-8
+            return self._fail(-1, str(e))
 
         try_request = True
         timeout_timestamp = time.time()
@@ -780,60 +1139,45 @@ class OSH_API():
 
         while try_request:  # Timeout guard
             try:
-                self.last_api_call_epoch = time.time()
-                s = inspect.stack()[0]
-                logging.info(f"{s.function} Calling API URL {self._url}/api/facilities/?{parameters}")
-                logging.info(f"{s.function} Calling API JSON {payload}")
-                r = requests.post(f"{self._url}/api/facilities/?{parameters}", headers=self._header, data=payload)
+                epoch, start = time.time(), time.perf_counter_ns()
+                # %-style arguments are only formatted if INFO logging is enabled
+                logging.info("post_facilities Calling API URL %s with %s", self._facilities_url, parameters)
+                logging.info("post_facilities Calling API with %s", payload)
+                r = self._session.post(self._post_facilities_url(parameters), data=body, headers=_FORM_CONTENT_TYPE)
                 timeout_attempt_no += 1
-                self._raw_data = copy.copy(r.text)
-                self.last_api_call_duration = time.time()-self.last_api_call_epoch
-                self._api_call_count += 1
+                self._set_last_response(r)
+                self._record_call(epoch, start)  # post_facilities_bulk calls this from worker threads
                 if r.ok:
-                    data = json.loads(r.text)
+                    data = _json_loads(r.content)
                     data = self._flatten_facilities_json(data)
                     self._result = {"code": 0, "message": f"{r.status_code}"}
                     self._error = False
                     try_request = False
                 else:
                     if r.status_code == 429:
-                        pattern = re.compile(".+in ([0-9]+) seconds")
-                        text = json.loads(r.text)["detail"]
-                        wait_time_text = pattern.findall(text)
-                        if len(wait_time_text) > 0:
-                            try:
-                                wait_time_s = int(wait_time_text[0])
-                            except Exception:
-                                self._result = {"code": -1, "message": f"{r.status_code} Unexpected: Could not detect timeout value, aborting"}
-                                self._error = True
-                                return {"status": "ERROR"}
+                        wait_time_s = self._rate_limit_wait(r)
+                        if wait_time_s is not None:
                             time_already_spent = time.time()-timeout_timestamp
                             if round(time_already_spent + wait_time_s - 0.5) <= timeout_secs:
                                 time.sleep(wait_time_s)
                                 continue
                             else:
-                                self._result = {"code": -2, "message": f"{r.status_code} Exceeded timeout after {timeout_attempt_no} attempt(s) (called with: {timeout_secs} s, asked for: {wait_time_s} s, already spent {time_already_spent:.2f} s)"}
-                                self._error = True
-                                return {"status": "TIMEOUT"}
+                                return self._fail(-2, f"{r.status_code} Exceeded timeout after {timeout_attempt_no} attempt(s) (called with: {timeout_secs} s, asked for: {wait_time_s} s, already spent {time_already_spent:.2f} s)", "TIMEOUT")
+                        else:
+                            return self._fail(-1, f"{r.status_code} Unexpected: Could not detect timeout value, aborting")
 
                     elif r.status_code == 400:
-                        self._result = {"code": -1, "message": f"{r.status_code} Bad Request"}
-                        self._error = True
-                        return {"status": "ERROR"}
+                        return self._fail(-1, f"{r.status_code} Bad Request")
                     else:
-                        self._result = {"code": -1, "message": f"{r.status_code}"}
-                        self._error = True
-                        return {"status": "ERROR"}
+                        return self._fail(-1, f"{r.status_code}")
             except Exception as e:
-                self._result = {"code": -1, "message": str(e)}
-                self._error = True
-                return {"status": "ERROR"}
+                return self._fail(-1, str(e))
 
         return data
 
     def post_facilities_bulk(self, records: list, cleanse: bool = False, 
                              auto_create = False, timeout: int = 15,
-                             column_mapping: dict = {}) -> list:
+                             column_mapping: dict = {}, max_workers: int = 4) -> list:
         """Add multiple records at once.
 
         This is a utility function that allows bulk upload of records, column name remapping, and
@@ -859,6 +1203,14 @@ class OSH_API():
             override the default. Note this is applied, per call, i.e. per row of data.
         column_mapping: dict, optional, default empty
             Mapping between source and OSH column names.
+        max_workers: int, optional, default 4
+            Number of records uploaded concurrently. Rate limiting is still handled per call, so keep this
+            modest; ``1`` uploads one record after the other. Results are always returned in the order of
+            ``records``, while :py:attr:`~pyoshub.OSH_API.result` reflects the call which finished last.
+
+        Records with the same name, address and country (compared case insensitively) are only looked up
+        once; the match result is kept for the lifetime of the object and reused by later calls, see
+        :py:meth:`~pyoshub.OSH_API.clear_match_cache`.
 
 
         Returns
@@ -892,119 +1244,382 @@ class OSH_API():
         .. attention::
           This function will become available at a later stage
         """
+        prepared = [self._prepare_record(record, cleanse, column_mapping) for record in records]
+        return self._upload_prepared(prepared, timeout, max_workers)
+
+    def post_facilities_bulk_df(self, df, cleanse: bool = False, timeout: int = 15,
+                                column_mapping: dict = {}, max_workers: int = 4) -> list:
+        """Add multiple records held in a :py:class:`pandas DataFrame <pandas:pandas.DataFrame>`, one row per
+        facility.
+
+        Works like :py:meth:`~pyoshub.OSH_API.post_facilities_bulk`, but cleansing is applied to whole
+        columns with vectorised pandas string operations before the rows are converted to records, which
+        is considerably faster for large frames. The DataFrame passed is not modified, missing values are
+        treated as empty.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Facilities to upload, the columns are the keys of the records.
+
+        ``cleanse``, ``timeout``, ``column_mapping`` and ``max_workers`` are the same as for
+        :py:meth:`~pyoshub.OSH_API.post_facilities_bulk`.
+
+        Returns
+        -------
+        list(dict)
+            Same as :py:meth:`~pyoshub.OSH_API.post_facilities_bulk`.
+        """
+        df = df.fillna("").astype(str)
+        original = df.apply(lambda column: column.str.strip())
+        if cleanse:
+            # same steps as _prepare_record, each one vectorised over a column
+            df = original.apply(lambda column: column.str.replace("N/A", "", regex=False)
+                                                     .str.replace(r"\s+", " ", regex=True)
+                                                     .str.replace(_CLEANSE_RE, ",", regex=True)
+                                                     .str.rstrip(", "))
+            cleansed = (df != original).any(axis=1).tolist()
+        else:
+            df = original
+            cleansed = [False]*len(df)
+
+        prepared = [(self._prepare_record(record, False, column_mapping)[0], was_cleansed)
+                    for record, was_cleansed in zip(df.to_dict(orient="records"), cleansed)]
+        return self._upload_prepared(prepared, timeout, max_workers)
+
+    def _upload_prepared(self, prepared: list, timeout: int, max_workers: int) -> list:
+        """Upload records prepared by :py:meth:`~pyoshub.OSH_API._prepare_record`, valid ones concurrently,
+        and return them merged with their match results, in the order given.
+
+        Internal use only.
+        """
         alldata = []
 
-        most_important_return_attributes = ['status', 'os_id', 'lon', 'lat', 'geocoded_address']
-        
-        for record in records:
-            new_record = {}
-            cleansed = False
-            for k,v in record.items():
-                v = v.strip()
-                if cleanse:
-                    while "N/A" in v:
-                        v = v.replace("N/A","").strip()
-                        cleansed = True
-                    while ", ," in v:
-                        v = v.replace(", ,",",").strip()
-                        cleansed = True
-                    while "  " in v:
-                        v = v.replace("  "," ").strip()
-                        cleansed = True
-                    while ",," in v:
-                        v = v.replace(",,",",").strip()
-                        cleansed = True
-                    while v.endswith(","):
-                        v = v[:-1].strip().strip()
-                        cleansed = True
-
-                if k in column_mapping.keys():
-                    new_record[column_mapping[k]] = v.strip()
+        # uploads wait on the network, so several records are in flight at once; results are collected in
+        # submission order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = []
+            keys = []
+            pending = {}  # duplicates within this call share one request
+            for new_record, cleansed in prepared:
+                key = None
+                future = None
+                if new_record["diagnosis"] == "VALID":
+                    key = self._match_key(new_record)
+                    if key in self._match_cache:
+                        future = concurrent.futures.Future()
+                        future.set_result(self._match_cache[key])
+                    elif key in pending:
+                        future = pending[key]
+                    else:
+                        future = pending[key] = executor.submit(self.post_facilities, data=new_record, create=False,
+                                                                 timeout_secs=timeout)
+                futures.append(future)
+                keys.append(key)
+
+            for (new_record, cleansed), future, key in zip(prepared, futures, keys):
+                if future is not None:
+                    result = future.result()
+                    if isinstance(result, list):  # errors are not cached
+                        self._match_cache[key] = result
+                    logging.info("post_facilities_bulk cleansed record %s", new_record)
+                    self._merge_match_result(new_record, result)
                 else:
-                    new_record[k] = v.strip()
-                    
-            to_delete = []
-            for k in new_record.keys():
-                if len(new_record[k]) == 0:
-                    to_delete.append(k)
-            for k in to_delete:
-                del new_record[k]
-    
-            if "country" in record.keys() and "name" in record.keys() and "address" in record.keys():
-                new_record["diagnosis"] = "VALID"
-                result = self.post_facilities(data=new_record,create=False)
-                s = inspect.stack()[0]
-                logging.info(f"{s.function} cleansed record {new_record}")
-                _ = """
-                ['item_id', 'lon', 'lat', 'geocoded_address', 'status', 'os_id']
-                [
-                  {
-                    "item_id": 804450,
-                    "lon": 51.9238373,
-                    "lat": 47.0944959,
-                    "geocoded_address": "Atyrau, Kazakhstan",
-                    "status": "NEW_FACILITY",
-                    "os_id": "KZ20222978AEQXH"
-                  }
-                ]"""
-                # now append new 
-                for match in result:
-                    if match["status"] == "NEW_FACILITY":
-                        new_record["match_no"] = -1
-                    # Lets make sure the more important attributes are on the left
-                    for key in most_important_return_attributes:
-                        new_record[key] = match[key]
-                    for k,v in match.items():
-                        if k not in most_important_return_attributes:
-                            new_record[k] = match[k]
-            else:
-                diagnosis = "MISSING column(s) "
-                missing = []
-                for field in ["name","address","country"]:
-                    if field not in record.keys():
-                        missing.append(field)
-                diagnosis += ",".join(missing)
-                new_record["diagnosis"] = diagnosis
-                self._result = {"code": -3, "message": diagnosis}
-                self._error = True
+                    self._result = {"code": -3, "message": new_record["diagnosis"]}
+                    self._error = True
 
-            new_record["cleansed"] = cleansed
-            alldata.append(new_record)
+                new_record["cleansed"] = cleansed
+                alldata.append(new_record)
 
         return alldata
 
-    def get_facilities_match_record(self, match_id: int = -1, match_url: str = "") -> list:
-        """This call is a utility call for retrieving a more detailed the match status result after a factory
-        was uploaded.
+    async def post_facilities_bulk_async(self, records: list, cleanse: bool = False, timeout: int = 15,
+                                         column_mapping: dict = {}, concurrency: int = 8) -> list:
+        """Asynchronous version of :py:meth:`~pyoshub.OSH_API.post_facilities_bulk`, all records are uploaded
+        from a single thread with up to ``concurrency`` requests in flight. Requires the optional
+        `httpx <https://www.python-httpx.org/>`_ package.
 
-        .. WARNING:: Implementation of this method has been postponed and an empty list will be returned.
+        .. code-block:: py
+
+            result = asyncio.run(osh_api.post_facilities_bulk_async(records, cleanse=True))
 
         Parameters
         ----------
-        match_id : int, optional
-            numeric match id, this is the ``id`` part of the voting URL ``/facility-matches/{id}/confirm/``
-            or reject, as returned from the post_facility call.
-        match_url : str, optional
-            This is the voting URL ``/facility-matches/{id}/confirm/`` or ``/facility-matches/{id}/reject/``
-            or reject, as returned from the post_facility call, which will be used to retrieve the numeric
-            ``match_id``
+        concurrency : int, optional, default = 8
+           Maximum number of uploads in flight at the same time. Rate limiting is still handled per call.
+
+        ``records``, ``cleanse``, ``timeout`` and ``column_mapping`` are the same as for
+        :py:meth:`~pyoshub.OSH_API.post_facilities_bulk`, records are matched without being created.
 
         Returns
         -------
         list(dict)
-            An array of dictionaries (key,value pairs). See table below for
-            return data structures.
+            Same as :py:meth:`~pyoshub.OSH_API.post_facilities_bulk`.
+        """
+        alldata = []
+        if httpx is None:
+            self._result = {"code": -1, "message": "post_facilities_bulk_async requires the httpx package"}
+            self._error = True
+            return alldata
+
+        prepared = [self._prepare_record(record, cleanse, column_mapping) for record in records]
+        parameters = {"create": "false", "public": "true", "textonlyfallback": "false"}
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+        async with httpx.AsyncClient(headers=self._header, limits=limits, timeout=30.0) as client:
+            async def post_one(payload: dict):
+                async with semaphore:
+                    return await self._post_facilities_async(client, payload, parameters, timeout)
+
+            tasks = {}  # duplicates share one request, like in post_facilities_bulk
+            for new_record, cleansed in prepared:
+                if new_record["diagnosis"] == "VALID":
+                    key = self._match_key(new_record)
+                    if key not in self._match_cache and key not in tasks:
+                        tasks[key] = asyncio.ensure_future(post_one(new_record))
+            await asyncio.gather(*tasks.values())
+
+        for new_record, cleansed in prepared:
+            if new_record["diagnosis"] == "VALID":
+                key = self._match_key(new_record)
+                if key in self._match_cache:
+                    result = self._match_cache[key]
+                else:
+                    result = tasks[key].result()
+                    if isinstance(result, list):  # errors are not cached
+                        self._match_cache[key] = result
+                self._merge_match_result(new_record, result)
+            else:
+                self._result = {"code": -3, "message": new_record["diagnosis"]}
+                self._error = True
+            new_record["cleansed"] = cleansed
+            alldata.append(new_record)
 
-            +------------------------------+---------------------------------------------------------+-------+
-            | column                       | description                                             | type  |
-            +==============================+=========================================================+=======+
-            | id                           | match_id                                                | int   |
-            +------------------------------+---------------------------------------------------------+-------+
-            | status                       | one of ``PENDING``, ``REJECTED``,                       | str   |
-            |                              |                                                         |       |
-            |                              | ``CONFIRMED``                                           |       |
-            +------------------------------+---------------------------------------------------------+-------+
-            | confidence                   | return value of the matching                            | str   |
+        return alldata
+
+    async def _post_facilities_async(self, client, payload: dict, parameters: dict,
+                                     timeout_secs: int) -> Union[list, dict]:
+        """Upload a single record through an ``httpx.AsyncClient``, with the same rate limit handling and
+        return values as :py:meth:`~pyoshub.OSH_API.post_facilities`.
+
+        Internal use only.
+        """
+        timeout_timestamp = time.time()
+        timeout_attempt_no = 0
+        try:
+            body = urllib.parse.urlencode(payload).encode()
+        except Exception as e:  # e.g. lone surrogates, which can't be encoded as UTF-8
+            return self._fail(-1, str(e))
+        try:
+            while True:
+                epoch, start = time.time(), time.perf_counter_ns()
+                r = _HttpxResponse(await client.post(self._post_facilities_url(parameters), content=body,
+                                                     headers=_FORM_CONTENT_TYPE))
+                timeout_attempt_no += 1
+                self._set_last_response(r)
+                self._record_call(epoch, start)
+                if r.ok:
+                    data = self._flatten_facilities_json(_json_loads(r.content))
+                    self._result = {"code": 0, "message": f"{r.status_code}"}
+                    self._error = False
+                    return data
+                elif r.status_code == 429:
+                    wait_time_s = self._rate_limit_wait(r)
+                    if wait_time_s is None:
+                        return self._fail(-1, f"{r.status_code} Unexpected: Could not detect timeout value, aborting")
+                    time_already_spent = time.time()-timeout_timestamp
+                    if round(time_already_spent + wait_time_s - 0.5) <= timeout_secs:
+                        await asyncio.sleep(wait_time_s)
+                        continue
+                    return self._fail(-2, f"{r.status_code} Exceeded timeout after {timeout_attempt_no} attempt(s) (called with: {timeout_secs} s, asked for: {wait_time_s} s, already spent {time_already_spent:.2f} s)", "TIMEOUT")
+                elif r.status_code == 400:
+                    return self._fail(-1, f"{r.status_code} Bad Request")
+                else:
+                    return self._fail(-1, f"{r.status_code}")
+        except Exception as e:
+            return self._fail(-1, str(e))
+
+    def _post_facilities_url(self, parameters: dict) -> str:
+        """URL of a facility upload with its query flags, see the ``create`` note of
+        :py:meth:`~pyoshub.OSH_API.post_facilities` about the leading ``??``.
+
+        Internal use only.
+        """
+        return f"{self._facilities_url}??{urllib.parse.urlencode(parameters)}"
+
+    def _fail(self, code: int, message: str, status: str = "ERROR") -> dict:
+        """Record a failed upload in :py:attr:`~pyoshub.OSH_API.result` and return the status dict
+        :py:meth:`~pyoshub.OSH_API.post_facilities` hands back in that case.
+
+        Internal use only.
+        """
+        self._result = {"code": code, "message": message}
+        self._error = True
+        return {"status": status}
+
+    def _rate_limit_wait(self, r) -> Union[int, None]:
+        """Seconds to wait before retrying a throttled (429) request, or None if the response doesn't say.
+
+        Internal use only.
+        """
+        # The message in the body carries the precise wait time, the Retry-After header sent alongside
+        # may be much longer (the whole throttling window), so it is only used if the body has no
+        # parsable wait time
+        try:
+            text = _json_loads(r.content)["detail"]
+        except Exception:
+            text = ""
+        wait_time_text = _RATE_LIMIT_RE.findall(text)
+        if len(wait_time_text) > 0:
+            return int(wait_time_text[0])
+        try:
+            return int(r.headers["Retry-After"])
+        except (KeyError, ValueError):  # may also be an HTTP date, which the server does not send
+            return None
+
+    def _match_key(self, record: dict) -> tuple:
+        """Key of the match cache, the case folded name, address and country of a record.
+
+        Internal use only.
+        """
+        return tuple(record.get(k, "").casefold() for k in ("name", "address", "country"))
+
+    def _merge_match_result(self, new_record: dict, result: Union[list, dict]) -> dict:
+        """Add the match(es) returned by :py:meth:`~pyoshub.OSH_API.post_facilities` to a bulk upload record.
+
+        Internal use only.
+        """
+        if isinstance(result, dict):  # failed upload, {"status": "ERROR"} or {"status": "TIMEOUT"}
+            new_record["status"] = result["status"]
+            return new_record
+
+        most_important_return_attributes = ['status', 'os_id', 'lon', 'lat', 'geocoded_address']
+        _ = """
+        ['item_id', 'lon', 'lat', 'geocoded_address', 'status', 'os_id']
+        [
+          {
+            "item_id": 804450,
+            "lon": 51.9238373,
+            "lat": 47.0944959,
+            "geocoded_address": "Atyrau, Kazakhstan",
+            "status": "NEW_FACILITY",
+            "os_id": "KZ20222978AEQXH"
+          }
+        ]"""
+        # now append new 
+        for match in result:
+            if match["status"] == "NEW_FACILITY":
+                new_record["match_no"] = -1
+            # Lets make sure the more important attributes are on the left, dicts keep insertion order
+            ordered = {k: match[k] for k in most_important_return_attributes if k in match}
+            ordered.update(match)
+            new_record.update(ordered)
+        return new_record
+
+    def clear_match_cache(self):
+        """Forget the match results :py:meth:`~pyoshub.OSH_API.post_facilities_bulk` remembered for records
+        uploaded so far, so they are looked up again. Entries don't expire otherwise.
+        """
+        self._match_cache.clear()
+
+    def invalidate_cache(self):
+        """Forget the reference data, e.g. countries or sectors, and the contributor data and counts fetched
+        so far, so the next call goes to the endpoint again. Entries otherwise expire after an hour for
+        reference data, and after one to ten minutes for the rest.
+        """
+        self._meta_cache.clear()
+        self._response_cache.clear()
+
+    def _cached(self, key: str, ttl: int, fetch):
+        """Return the data remembered for ``key`` if it is younger than ``ttl`` seconds, otherwise call ``fetch``
+        and remember its result if the call succeeded.
+        """
+        entry = self._meta_cache.get(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            self._result = {"code": 0, "message": "cached"}
+            self._error = False
+            return entry[1]
+        data = fetch()
+        if self._result["code"] == 0:
+            self._meta_cache[key] = (time.time(), data)
+        return data
+
+    def _prepare_record(self, record: dict, cleanse: bool, column_mapping: dict) -> tuple:
+        """Strip, optionally cleanse, and rename the values of a record for upload, and diagnose whether it
+        has all required columns.
+
+        Internal use only.
+
+        Returns
+        -------
+        tuple(dict, bool)
+            The prepared record, with its ``diagnosis`` set, and whether cleansing changed any value.
+        """
+        # required columns are checked before any value is touched, blank values count as missing
+        missing = [field for field in ["name","address","country"] if not str(record.get(field, "")).strip()]
+
+        new_record = {}
+        cleansed = False
+        for k,v in record.items():
+            v = v.strip()
+            if cleanse:
+                # N/A goes first, its removal may leave commas or blanks next to each other; split/join
+                # collapses any run of whitespace in one pass
+                new_v = " ".join(v.replace("N/A", "").split())
+                new_v = _CLEANSE_RE.sub(",", new_v).rstrip(", ")
+                if new_v != v:
+                    v = new_v
+                    cleansed = True
+
+            # v is already stripped
+            if k in column_mapping:
+                new_record[column_mapping[k]] = v
+            else:
+                new_record[k] = v
+
+        for k in [k for k, v in new_record.items() if not v]:
+            del new_record[k]
+
+        if missing:
+            new_record["diagnosis"] = "MISSING column(s) " + ",".join(missing)
+        else:
+            new_record["diagnosis"] = "VALID"
+
+        return new_record, cleansed
+
+    def get_facilities_match_record(self, match_id: int = -1, match_url: str = "") -> list:
+        """This call is a utility call for retrieving a more detailed the match status result after a factory
+        was uploaded.
+
+        .. WARNING:: Implementation of this method has been postponed and an empty list will be returned.
+
+        Parameters
+        ----------
+        match_id : int, optional
+            numeric match id, this is the ``id`` part of the voting URL ``/facility-matches/{id}/confirm/``
+            or reject, as returned from the post_facility call.
+        match_url : str, optional
+            This is the voting URL ``/facility-matches/{id}/confirm/`` or ``/facility-matches/{id}/reject/``
+            or reject, as returned from the post_facility call, which will be used to retrieve the numeric
+            ``match_id``
+
+        Returns
+        -------
+        list(dict)
+            An array of dictionaries (key,value pairs). See table below for
+            return data structures.
+
+            +------------------------------+---------------------------------------------------------+-------+
+            | column                       | description                                             | type  |
+            +==============================+=========================================================+=======+
+            | id                           | match_id                                                | int   |
+            +------------------------------+---------------------------------------------------------+-------+
+            | status                       | one of ``PENDING``, ``REJECTED``,                       | str   |
+            |                              |                                                         |       |
+            |                              | ``CONFIRMED``                                           |       |
+            +------------------------------+---------------------------------------------------------+-------+
+            | confidence                   | return value of the matching                            | str   |
             |                              |                                                         |       |
             |                              | algorithm, str formatted float                          |       |
             +------------------------------+---------------------------------------------------------+-------+
@@ -1101,66 +1716,19 @@ class OSH_API():
             +-----------------+----------------------------------------------+-------+
         """
         if len(match_url) > 0:
-            url_to_call = match_url
+            url_to_call = f"{self._url}{match_url}"
         elif match_id > 0:
-            url_to_call = f"/api/facility-matches/{match_id}/confirm/"
+            url_to_call = f"{self._facility_matches_url}{match_id}/confirm/"
         else:
             data = {"status": "need a valid match_id or match_url"}
             self._result = {"code": -1, "message": "need a valid match_id or match_url"}
             self._error = True
             return data
 
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.post(f"{self._url}{url_to_call}", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = json.loads(r.text)
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-
-                new_data = {}
-
-                for k, v in data.items():
-                    if k == "matched_facility":
-                        for kk, vv in v.items():
-                            if kk == "location":
-                                new_data["matched_lat"] = vv["lat"]
-                                new_data["matched_lon"] = vv["lng"]
-                            elif "created_from_id" == kk:
-                                continue
-                            else:
-                                new_data[f"matched_{kk}"] = vv
-                    elif k == "sector":
-                        new_data[k] = "|".join(v)
-                    elif isinstance(v, dict):
-                        pass
-                    elif isinstance(v, list):
-                        pass
-                    elif k in ["raw_data", "row_index", "source"]:
-                        continue
-                    elif k.startswith("ppe_"):
-                        continue
-                    elif k.startswith("processing_"):
-                        continue
-                    elif k.startswith("clean_"):
-                        continue
-                    else:
-                        new_data[k] = v
-
-                data = new_data
-            else:
-                data = {"status": "HTTP_ERROR"}
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
-
-        return data
+        data, ok = self._request("POST", url_to_call)
+        if ok:
+            return self._flatten_match_response(data)
+        return {"status": "HTTP_ERROR"}
 
     def post_facility_match_reject(self, match_id: int = -1, match_url: str = "") -> list:
         """Confirm a match to an existing record as a response to a ``post_facilities`` call,
@@ -1213,71 +1781,62 @@ class OSH_API():
         """
 
         if len(match_url) > 0:
-            url_to_call = match_url
+            url_to_call = f"{self._url}{match_url}"
         elif match_id > 0:
-            url_to_call = f"/api/facility-matches/{match_id}/reject/"
+            url_to_call = f"{self._facility_matches_url}{match_id}/reject/"
         else:
             data = {"status": "need a valid match_id or match_url"}
             self._result = {"code": -1, "message": "need a valid match_id or match_url"}
             self._error = True
             return data
 
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.post(f"{self._url}{url_to_call}", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = json.loads(r.text)
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
+        data, ok = self._request("POST", url_to_call)
+        if ok:
+            return self._flatten_match_response(data)
+        return {"status": "HTTP_ERROR"}
 
-                new_data = {}
+    def post_facility_matches_bulk(self, decisions: list, max_workers: int = 8) -> list:
+        """Confirm or reject several matches at once.
 
-                for k, v in data.items():
-                    if k == "matched_facility":
-                        for kk, vv in v.items():
-                            if kk == "location":
-                                new_data["matched_lat"] = vv["lat"]
-                                new_data["matched_lon"] = vv["lng"]
-                            elif "created_from_id" == kk:
-                                continue
-                            else:
-                                new_data[f"matched_{kk}"] = vv
-                    elif k == "sector":
-                        new_data[k] = "|".join(v)
-                    elif isinstance(v, dict):
-                        pass
-                    elif isinstance(v, list):
-                        pass
-                    elif k in ["raw_data", "row_index", "source"]:
-                        continue
-                    elif k.startswith("ppe_"):
-                        continue
-                    elif k.startswith("processing_"):
-                        continue
-                    elif k.startswith("clean_"):
-                        continue
-                    else:
-                        new_data[k] = v
+        Votes are independent of each other, so they are sent concurrently.
 
-                data = new_data
-            else:
-                data = {"status": "HTTP_ERROR"}
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
+        Parameters
+        ----------
+        decisions : list
+            A list of ``(match_id, confirm)`` pairs. ``match_id`` is either the numeric match id or the
+            voting URL as returned from the post_facility call, ``confirm`` is ``True`` to confirm and
+            ``False`` to reject the match.
+        max_workers : int, optional, default = 8
+            Number of votes sent at the same time. Results are always returned in the order of ``decisions``,
+            while :py:attr:`~pyoshub.OSH_API.result`, :py:attr:`~pyoshub.OSH_API.error` and the last response
+            only reflect the vote which finished last; check the ``status`` of each result instead.
 
-        return data
+        Returns
+        -------
+        list
+            The results of :py:meth:`~pyoshub.OSH_API.post_facility_match_confirm` or
+            :py:meth:`~pyoshub.OSH_API.post_facility_match_reject` for each decision, in the order given.
+            A failed vote returns ``{"status": "HTTP_ERROR"}``.
+        """
+        def vote(decision):
+            match, confirm = decision
+            method = self.post_facility_match_confirm if confirm else self.post_facility_match_reject
+            if isinstance(match, str):
+                return method(match_url=match)
+            return method(match_id=match)
 
-    def get_contributor_types(self) -> list:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(vote, decisions))
+
+    def get_contributor_types(self, flat: bool = False) -> list:
         """Get a list of contributor type choices. The original REST API returns a list of pairs of values and display names.
         As all display names and values are identical, we only return the values used in the database.
 
+        Parameters
+        ----------
+        flat : bool, optional, default = False
+            Return a list of the contributor type texts instead of dictionaries.
+
         Returns
         -------
         list(dict)
@@ -1290,32 +1849,25 @@ class OSH_API():
            |contributor_type | The values of contributor types | str  |
            +-----------------+---------------------------------+------+
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/contributor-types", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-
-            if r.ok:
-                data = [{"contributor_type": value} for value, display in json.loads(r.text)]
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-            self._contributors = data
-            self._error = False
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._contributors = []
-            self._error = True
-            return []
+        # the flat form is cached, the dictionaries are built on demand
+        data = self._cached("contributor-types", _METADATA_TTL, self._fetch_contributor_types)
+        if flat:
+            return list(data)
+        self._contributors = [{"contributor_type": value} for value in data]
+        return self._contributors
 
-        return data
+    def _fetch_contributor_types(self) -> list:
+        data, ok = self._request("GET", self._contributor_types_url)
+        return [value for value, display in data] if ok else []
 
-    def get_countries(self) -> list:
+    def get_countries(self, flat: bool = False) -> list:
         """Get a list of `ISO 3166-2 Alpha 2 country codes and English short names <https://www.iso.org/obp/ui/#search>` used.
 
+        Parameters
+        ----------
+        flat : bool, optional, default = False
+            Return a list of ``(iso_3166_2, country)`` tuples instead of dictionaries.
+
         Returns
         -------
         list(dict)
@@ -1330,26 +1882,15 @@ class OSH_API():
            |country    | ISO 3166 Country Name           | str  |
            +-----------+---------------------------------+------+
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/countries", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = [{"iso_3166_2": cid, "country": con} for cid, con in json.loads(r.text)]
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-            self.countries = data
-            self._error = False
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
+        data = self._cached("countries", _METADATA_TTL, self._fetch_countries)
+        if flat:
+            return list(data)
+        self.countries = [{"iso_3166_2": cid, "country": con} for cid, con in data]
+        return self.countries
 
-        return data
+    def _fetch_countries(self) -> list:
+        data, ok = self._request("GET", self._countries_url)
+        return [(cid, con) for cid, con in data] if ok else []
 
     def get_countries_active_count(self) -> int:
         """Get a count of disctinct country codes used by active facilities.
@@ -1360,26 +1901,8 @@ class OSH_API():
            disctinct country codes used by active facilities
         """
 
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/countries/active_count", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = int(json.loads(r.text)["count"])
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-            else:
-                data = {}
-                data = -1
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-            self.countries_active_count = data
-            self._error = False
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
-
+        data = self._get_count(self._countries_active_count_url)
+        self.countries_active_count = data
         return data
 
     def get_facility_processing_types(self) -> list:
@@ -1399,41 +1922,29 @@ class OSH_API():
            |processing_type  | Processing, e.g. *Packaging*, for the facility type | str  |
            +-----------------+-----------------------------------------------------+------+
         """
-
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/facility-processing-types/", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = json.loads(r.text)
-                facility_processing_types = data
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                alldata = []
-                for facility_processing_type in facility_processing_types:
-                    for processingType in facility_processing_type["processingTypes"]:
-                        alldata.append({
-                            "facility_type": facility_processing_type["facilityType"],
-                            "processing_type": processingType
-                        })
-                data = alldata
-                self._error = False
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
-
+        return self._cached("facility-processing-types", _METADATA_TTL, self._fetch_facility_processing_types)
+
+    def _fetch_facility_processing_types(self) -> list:
+        data, ok = self._request("GET", self._facility_processing_types_url)
+        if ok:
+            data = [
+                {"facility_type": facility_processing_type["facilityType"], "processing_type": processing_type}
+                for facility_processing_type in data
+                for processing_type in facility_processing_type["processingTypes"]
+            ]
+        else:
+            data = []
         self.facility_processing_types = data
         return data
 
-    def get_product_types(self) -> list:
+    def get_product_types(self, flat: bool = False) -> list:
         """Returns a list of product types specified in the database
 
+        Parameters
+        ----------
+        flat : bool, optional, default = False
+            Return a list of the product type names instead of dictionaries.
+
         Returns
         -------
         list(dict)
@@ -1446,29 +1957,17 @@ class OSH_API():
            |product_type     | Name of product type as uploaded to the database    | str  |
            +-----------------+-----------------------------------------------------+------+
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/product-types/", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = [{"product_type": sector} for sector in json.loads(r.text)]
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self.product_types = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
+        data = self._cached("product-types", _METADATA_TTL, self._fetch_product_types)
+        if flat:
+            return list(data)
+        self.product_types = [{"product_type": product_type} for product_type in data]
+        return self.product_types
 
-        return data
+    def _fetch_product_types(self) -> list:
+        data, ok = self._request("GET", self._product_types_url)
+        return data if ok else []
 
-    def get_sectors(self) -> int:
+    def get_sectors(self, flat: bool = False) -> list:
         """Returns a list of sectors defined at the time of import.
 
         The sectors list is assumed to evolve over time as we better understand how to structure our data and
@@ -1476,6 +1975,11 @@ class OSH_API():
         in the sector field to the sector list values. If a match is found, the sector value will be
         used. If no match is found, the sector value will be set to ``Unspecified``.
 
+        Parameters
+        ----------
+        flat : bool, optional, default = False
+            Return a list of the sector names instead of dictionaries.
+
         Returns
         -------
         list(dict)
@@ -1488,27 +1992,15 @@ class OSH_API():
            |sector           | Name of sector defined in the database              | str  |
            +-----------------+-----------------------------------------------------+------+
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/sectors/", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = [{"sector": sector} for sector in json.loads(r.text)]
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self.sectors = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
+        data = self._cached("sectors", _METADATA_TTL, self._fetch_sectors)
+        if flat:
+            return list(data)
+        self.sectors = [{"sector": sector} for sector in data]
+        return self.sectors
 
-        return data
+    def _fetch_sectors(self) -> list:
+        data, ok = self._request("GET", self._sectors_url)
+        return data if ok else []
 
     def get_workers_ranges(self) -> list:
         """Retrieve allowed texts for workes range specification, and their range:
@@ -1532,48 +2024,35 @@ class OSH_API():
            |upper            | Numeric upper limit to select text ``n >= lower``   | int  |
            +-----------------+-----------------------------------------------------+------+
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/workers-ranges/", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                workers_ranges = json.loads(r.text)
-                alldata = []
-                for workers_range in workers_ranges:
-                    if "-" in workers_range:
-                        lower, upper = workers_range.split("-")
-                    elif "Less" in workers_range:
-                        upper = workers_range.split(" ")[-1]
-                        lower = 1
-                    elif "More" in workers_range:
-                        lower = workers_range.split(" ")[-1]
-                        upper = 99999999
-                    else:
-                        lower = -1
-                        upper = -1
-                    alldata.append({
-                        "workers_range": workers_range,
-                        "lower": int(lower),
-                        "upper": int(upper),
-                    })
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                data = alldata
-                self._error = False
-            else:
-                data = {
-                        "workers_range": [],
-                        "lower": [],
-                        "upper": [],
-                }
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self.workers_ranges = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
+        return self._cached("workers-ranges", _METADATA_TTL, self._fetch_workers_ranges)
+
+    def _fetch_workers_ranges(self) -> list:
+        data, ok = self._request("GET", self._workers_ranges_url)
+        if ok:
+            alldata = []
+            for workers_range in data:
+                m = _WORKERS_RANGE_RE.match(workers_range)
+                if m is None:
+                    lower, upper = -1, -1
+                elif m[1]:
+                    lower, upper = int(m[1]), int(m[2])
+                elif m[3]:
+                    lower, upper = 1, int(m[3])
+                else:
+                    lower, upper = int(m[4]), 99999999
+                alldata.append({
+                    "workers_range": workers_range,
+                    "lower": lower,
+                    "upper": upper,
+                })
+            data = alldata
+        else:
+            data = {
+                    "workers_range": [],
+                    "lower": [],
+                    "upper": [],
+            }
+        self.workers_ranges = data
         return data
 
     def post_disassociate_facility(self, osh_id: str) -> list:
@@ -1795,7 +2274,7 @@ class OSH_API():
 
         return self.post_facility_open_or_closed(osh_id, "CLOSED", reason_for_report)
 
-    def get_contributor_lists(self, contributor_id: Union[int, str]) -> list:
+    def get_contributor_lists(self, contributor_id: Union[int, str], flat: bool = False) -> list:
         """Get lists for specific contributor.
 
         For interactive uploads, data are organised along the notion of lists. Suppliers often publish
@@ -1808,6 +2287,8 @@ class OSH_API():
         ----------
         contributor_id: int or str
            numeric contributor id
+        flat : bool, optional, default = False
+            Return a list of ``(list_id, list_name)`` tuples instead of dictionaries.
 
         Returns
         -------
@@ -1825,32 +2306,25 @@ class OSH_API():
            |list_name  | The name of the list            | str  |
            +-----------+---------------------------------+------+
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/contributor-lists/?contributors={contributor_id}", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-
-            if r.ok:
-                data = [{"list_id": cid, "list_name": con} for cid, con in json.loads(r.text)]
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self._contributors = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
-
+        data, ok = self._cached_get(f"{self._contributor_lists_url}?contributors={contributor_id}",
+                                    _CONTRIBUTOR_LISTS_TTL)
+        if not ok:
+            data = []
+        elif flat:
+            data = [(cid, con) for cid, con in data]
+        else:
+            data = [{"list_id": cid, "list_name": con} for cid, con in data]
+        self._contributors = data
         return data
 
-    def get_contributors(self) -> list:
+    def get_contributors(self, flat: bool = False) -> list:
         """Get a list of contributors and their ID.
 
+        Parameters
+        ----------
+        flat : bool, optional, default = False
+            Return a list of ``(contributor_id, contributor_name)`` tuples instead of dictionaries.
+
         Returns
         -------
         list(dict)
@@ -1865,27 +2339,14 @@ class OSH_API():
             |contributor_name | The name of the contributor       | str  |
             +-----------------+-----------------------------------+------+
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/contributors", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-
-            if r.ok:
-                data = [{"contributor_id": cid, "contributor_name": con} for cid, con in json.loads(r.text)]
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self._contributors = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
-
+        data, ok = self._cached_get(self._contributors_url, _CONTRIBUTORS_TTL)
+        if not ok:
+            data = []
+        elif flat:
+            data = [(cid, con) for cid, con in data]
+        else:
+            data = [{"contributor_id": cid, "contributor_name": con} for cid, con in data]
+        self._contributors = data
         return data
 
     def get_contributors_active_count(self) -> int:
@@ -1896,30 +2357,16 @@ class OSH_API():
         active_count: int
            Number of active contributors
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/contributors/active_count", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = int(json.loads(r.text)["count"])
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-            else:
-                data = -1
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self.countries_active_count = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
+        data = self._get_count(self._contributors_active_count_url, ttl=_COUNT_TTL)
+        self.countries_active_count = data
         return data
 
     def get_facility(self, osh_id: str, return_extended_fields: bool = False) -> dict:
         """Return detail on one facility
 
+        .. note::
+          To look up many facilities, use :py:meth:`~pyoshub.OSH_API.get_facilities_by_id`.
+
         Parameters
         ----------
         osh_id: str
@@ -2011,61 +2458,129 @@ class OSH_API():
             | sector                        | Business sector                               | str   |
             +-------------------------------+-----------------------------------------------+-------+
         """
+        data, ok = self._request("GET", f"{self._facilities_url}{osh_id}/")
+        if not ok:
+            return {}
         try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/facilities/{osh_id}/", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = json.loads(r.text)
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-
-                entry = {
-                    "id": data["id"],
-                    "lon": data["geometry"]["coordinates"][0],
-                    "lat": data["geometry"]["coordinates"][1]
-                }
-                for k, v in data["properties"].items():
-                    if k.startswith("ppe_") or k == "new_os_id":
-                        continue
-                    elif isinstance(v, list):
-                        if len(v) > 0 and isinstance(v[0], dict):
-                            lines = []
-                            for vv in v:
-                                lines.append("|".join([f"{kkk}:{vvv}" for kkk, vvv in vv.items()]))
-                            entry[k] = "\n".join(lines).replace("lng:", "lon:")
-                        else:
-                            entry[k] = "\n".join(v)
-                    elif k == "extended_fields" and return_extended_fields:
-                        for kk in v.keys():
-                            lines = []
-                            for vv in v[kk]:
-                                lines.append("|".join([f"{kkk}:{vvv}" for kkk, vvv in vv.items()]))
-                            entry[f"{kk}_extended"] = "\n".join(lines).replace("lng:", "lon:")
-                    elif k == "created_from":
-                        self.v = v.copy()
-                        entry[k] = "|".join([f"{kkk}:{vvv}" for kkk, vvv in v.items()])
-                    elif k == "extended_fields" and not return_extended_fields:
-                        pass
-                    else:
-                        if v is not None:
-                            entry[k] = v
-                        else:
-                            entry[k] = ""
-
-                data = entry.copy()
-                self._error = False
-            else:
-                data = {}
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
+            return self._facility_from_feature(data, return_extended_fields)
         except Exception as e:
             self._result = {"code": -1, "message": str(e)}
             self._error = True
             return {}
 
-        return data
+    def get_facilities_by_id(self, osh_ids: list, return_extended_fields: bool = False,
+                             max_workers: int = 8) -> list:
+        """Return detail on several facilities, see :py:meth:`~pyoshub.OSH_API.get_facility`.
+
+        The API has no filter for a list of OS IDs, so facilities are looked up one by one, several at the same
+        time. IDs given more than once are only looked up once.
+
+        Parameters
+        ----------
+        osh_ids: list(str)
+           sixteen character OS IDs
+        return_extended_fields: bool, optional, default = False
+           Also return the extended fields, see :py:meth:`~pyoshub.OSH_API.get_facility`
+        max_workers: int, optional, default = 8
+           Number of facilities looked up at the same time
+
+        Returns
+        -------
+        list(dict)
+            One dictionary per OS ID given, in the same order, as returned by
+            :py:meth:`~pyoshub.OSH_API.get_facility`. Facilities which could not be retrieved are returned as
+            empty dictionaries.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {}
+            for osh_id in osh_ids:
+                if osh_id not in futures:
+                    futures[osh_id] = executor.submit(self.get_facility, osh_id, return_extended_fields)
+            return [dict(futures[osh_id].result()) for osh_id in osh_ids]
+
+    async def get_facilities_by_id_async(self, osh_ids: list, return_extended_fields: bool = False,
+                                         concurrency: int = 8) -> list:
+        """Asynchronous version of :py:meth:`~pyoshub.OSH_API.get_facilities_by_id`, all facilities are looked
+        up from a single thread with up to ``concurrency`` requests in flight. Requires the optional
+        `httpx <https://www.python-httpx.org/>`_ package.
+
+        .. code-block:: py
+
+            result = asyncio.run(osh_api.get_facilities_by_id_async(["DE20211253G9MQX", "CN2021250D1DTN7"]))
+
+        Parameters
+        ----------
+        concurrency : int, optional, default = 8
+           Maximum number of requests in flight at the same time.
+
+        ``osh_ids`` and ``return_extended_fields`` are the same as for
+        :py:meth:`~pyoshub.OSH_API.get_facilities_by_id`.
+
+        Returns
+        -------
+        list(dict)
+            Same as :py:meth:`~pyoshub.OSH_API.get_facilities_by_id`.
+        """
+        if httpx is None:
+            self._result = {"code": -1, "message": "get_facilities_by_id_async requires the httpx package"}
+            self._error = True
+            return [{} for osh_id in osh_ids]
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(client, osh_id: str) -> dict:
+            async with semaphore:
+                try:
+                    epoch, start = time.time(), time.perf_counter_ns()
+                    r = _HttpxResponse(await client.get(f"{self._facilities_url}{osh_id}/"))
+                    self._record_call(epoch, start)
+                    self._set_last_response(r)
+                    data, ok = self._parse(r)
+                    return self._facility_from_feature(data, return_extended_fields) if ok else {}
+                except Exception as e:
+                    self._result = {"code": -1, "message": str(e)}
+                    self._error = True
+                    return {}
+
+        unique_ids = list(dict.fromkeys(osh_ids))  # IDs given more than once are looked up once
+        limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+        async with httpx.AsyncClient(headers=self._header, limits=limits, timeout=30.0) as client:
+            results = await asyncio.gather(*[fetch(client, osh_id) for osh_id in unique_ids])
+        facilities = dict(zip(unique_ids, results))
+        return [dict(facilities[osh_id]) for osh_id in osh_ids]
+
+    def _facility_from_feature(self, data: dict, return_extended_fields: bool = False) -> dict:
+        """Flatten a facility GeoJSON feature as returned by the facility detail endpoint.
+
+        Internal use only.
+        """
+        entry = {
+            "id": data["id"],
+            "lon": data["geometry"]["coordinates"][0],
+            "lat": data["geometry"]["coordinates"][1]
+        }
+        # the flag is decided once, extended fields are simply skipped when not asked for
+        skip_keys = _FACILITY_SKIP_KEYS if return_extended_fields else _FACILITY_BASIC_SKIP_KEYS
+        for k, v in data["properties"].items():
+            if k in skip_keys or k.startswith(_FACILITY_SKIP_PREFIXES):
+                continue
+            elif isinstance(v, list):
+                if len(v) > 0 and isinstance(v[0], dict):
+                    entry[k] = _rows_to_text(v)
+                else:
+                    entry[k] = "\n".join(v)
+            elif k == "extended_fields":
+                for kk, rows in v.items():
+                    entry[f"{kk}_extended"] = _rows_to_text(rows)
+            elif k == "created_from":
+                self.v = v.copy()
+                entry[k] = "|".join([f"{kkk}:{vvv}" for kkk, vvv in v.items()])
+            else:
+                if v is not None:
+                    entry[k] = v
+                else:
+                    entry[k] = ""
+        return entry
 
     def get_facilities_count(self) -> int:
         """Return the number of facilities in the database.
@@ -2078,35 +2593,22 @@ class OSH_API():
         active_count: int
            disctinct country codes used by active facilities
         """
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/facilities/count", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = int(json.loads(r.text)["count"])
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-            else:
-                data = -1
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self.countries_active_count = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return
-
+        data = self._get_count(self._facilities_count_url, ttl=_COUNT_TTL)
+        self.countries_active_count = data
         return data
 
-    def get_parent_companies(self) -> list:
+    def get_parent_companies(self, flat: bool = False) -> list:
         """Returns a list of parent companies and either contributor ID of contributor name.
 
         .. note::
           This API call is likely to be retired and possibly replaced with a more user friendly
           version.
 
+        Parameters
+        ----------
+        flat : bool, optional, default = False
+            Return a list of ``(key_or_contributor, parent_company)`` tuples instead of dictionaries.
+
         Returns
         -------
         list(dict)
@@ -2122,36 +2624,39 @@ class OSH_API():
            +------------------+----------------------------------------------------+-------------+
         """
 
-        try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/parent-companies/", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
-            if r.ok:
-                data = [{"key_or_contributor": k, "parent_company": p} for k, p in json.loads(r.text)]
-                self._result = {"code": 0, "message": f"{r.status_code}"}
-                self._error = False
-            else:
-                data = []
-                self._result = {"code": -1, "message": f"{r.status_code}"}
-                self._error = True
-            self.parent_companies = data
-        except Exception as e:
-            self._result = {"code": -1, "message": str(e)}
-            self._error = True
-            return []
-
+        data, ok = self._cached_get(self._parent_companies_url, _CONTRIBUTORS_TTL)
+        if not ok:
+            data = []
+        elif flat:
+            return [(k, p) for k, p in data]
+        else:
+            data = [{"key_or_contributor": k, "parent_company": p} for k, p in data]
+        self.parent_companies = data
         return data
 
-    def get_facilities_downloads(self) -> list:
+    def get_facilities_downloads(self, stream: bool = False, max_workers: int = 8, as_dataframe: bool = False) -> list:
         """Returns a list of facilities.
 
+        Parameters
+        ----------
+        stream : bool, optional
+           Parse responses incrementally while they are being downloaded, instead of loading each page
+           into memory first, see :py:meth:`~pyoshub.OSH_API.get_facilities`.
+           Requires the optional `ijson <https://pypi.org/project/ijson/>`_ package.
+        max_workers : int, optional, default = 8
+           Number of pages downloaded at the same time once the first page has been read. Pages are
+           fetched one after the other when streaming.
+        as_dataframe : bool, optional, default = False
+           Return a :py:class:`pandas DataFrame <pandas:pandas.DataFrame>` built in one go from the rows and
+           headers sent by the server, skipping the per-row dictionaries, which is considerably faster for
+           large downloads. Requires the optional `pandas <https://pypi.org/project/pandas/>`_ package, an
+           empty list is returned with an error result if it is not installed.
+
         Returns
         -------
         list(dict)
-            An array of dictionaries (key,value pairs). See table below for
-            return data structures.
+            An array of dictionaries (key,value pairs), or a DataFrame with the same columns when
+            ``as_dataframe`` is set. See table below for return data structures.
 
 
             +-----------------------------------+-----------------------------------------------+-------+
@@ -2192,41 +2697,67 @@ class OSH_API():
             | is_closed                         |                                               | str   |
             +-----------------------------------+-----------------------------------------------+-------+
         """
-        have_next = True
-        request_url = f"{self._url}/api/facilities-downloads/"
+        if as_dataframe:
+            try:
+                import pandas  # noqa: F401
+            except ImportError:
+                self._result = {"code": -1, "message": "as_dataframe=True requires the pandas package"}
+                self._error = True
+                return []
+        if stream:
+            return self._get_facilities_downloads_stream(as_dataframe)
+
+        request_url = self._facilities_downloads_url
         alldata = []
+        headers = []
+        executor = None
+        prefetched = []  # futures of the remaining pages, in page order
 
-        while have_next:
-            try:
-                self.last_api_call_epoch = time.time()
-                r = requests.get(request_url, headers=self._header)
-                self._raw_data = copy.copy(r.text)
-                self.last_api_call_duration = time.time()-self.last_api_call_epoch
-                self._api_call_count += 1
+        try:
+            while request_url is not None or prefetched:
+                if prefetched:
+                    r = prefetched.pop(0).result()
+                else:
+                    r = self._get_timed(request_url)
+                    request_url = None
+                self._set_last_response(r)
 
                 if r.ok:
-                    data = json.loads(r.text)
-
-                    for row in data["results"]["rows"]:
-                        alldata.append(dict(zip(data["results"]["headers"], row)))
+                    data = _json_loads(r.content)
+                    headers = data["results"]["headers"]
+                    rows = data["results"]["rows"]
+                    if as_dataframe:
+                        alldata.extend(rows)
+                    else:
+                        alldata.extend([dict(zip(headers, row)) for row in rows])
 
                     self._result = {"code": 0, "message": f"{r.status_code}"}
-                    if 'next' in data.keys() and data["next"] is not None:
-                        request_url = data["next"]
-                    else:
-                        have_next = False
                     self._error = False
+                    if executor is None and data.get("next") is not None:
+                        # once the first page tells how many there are, all others are fetched concurrently,
+                        # unless the next URL can't be continued, then pages are followed one by one
+                        page_urls = _page_urls(data["next"], data.get("count"), len(rows))
+                        if page_urls:
+                            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers))
+                            prefetched = [executor.submit(self._get_timed, url) for url in page_urls]
+                        else:
+                            request_url = data["next"]
+                    elif executor is None:
+                        request_url = data.get("next")
                 else:
                     self._result = {"code": -1, "message": f"{r.status_code}"}
-                    have_next = False
                     self._error = True
-                    return alldata
-            except Exception as e:
-                self._result = {"code": -1, "message": str(e)}
-                self._error = True
-                return alldata
+                    break
+        except Exception as e:
+            self._result = {"code": -1, "message": str(e)}
+            self._error = True
+        finally:
+            if executor is not None:
+                for future in prefetched:
+                    future.cancel()
+                executor.shutdown()
 
-        return alldata
+        return _rows_to_dataframe(headers, alldata) if as_dataframe else alldata
 
     def get_contributor_embed_configs(self, contributor_id: Union[int, str]) -> list:
         """Get embedded maps configuration for specific contributor.
@@ -2279,142 +2810,507 @@ class OSH_API():
         """
 
         try:
-            self.last_api_call_epoch = time.time()
-            r = requests.get(f"{self._url}/api/contributor-embed-configs/{contributor_id}/", headers=self._header)
-            self._raw_data = copy.copy(r.text)
-            self.last_api_call_duration = time.time()-self.last_api_call_epoch
-            self._api_call_count += 1
+            epoch, start = time.time(), time.perf_counter_ns()
+            r = self._session.get(f"{self._contributor_embed_configs_url}{contributor_id}/")
+            self._set_last_response(r)
+            self._record_call(epoch, start)
 
             if r.ok:
-                data = json.loads(r.text)
-                alldata = {}
+                data = _json_loads(r.content)
+                # the two renamed keys are taken out first, so the remaining loop only needs to special case the lists
+                alldata = {new_key: data.pop(k) for k, new_key in (("id", "embedded_map_id"), ("contributor", "contributor_id"))
+                           if k in data}
                 num_undefined = 1
-                have_undefined = False
                 for k, v in data.items():
                     if k == 'embed_fields':
                         for embedded_field in v:
-                            for column in ['display_name', 'visible', 'order', 'searchable']:
-                                if len(embedded_field["column_name"]) == 0:  # ref https://github.com/open-apparel-registry/open-apparel-registry/issues/2200
-                                    have_undefined = True
-                                    alldata[f'undefined_{num_undefined}_{column}'] = embedded_field[column]
-                                else:
-                                    have_undefined = False
-                                    alldata[f'{embedded_field["column_name"]}_{column}'] = embedded_field[column]
-                            if have_undefined:
+                            is_undefined = not embedded_field["column_name"]  # ref https://github.com/open-apparel-registry/open-apparel-registry/issues/2200
+                            prefix = f'undefined_{num_undefined}' if is_undefined else embedded_field["column_name"]
+                            for column in _EMBED_COLUMNS:
+                                alldata[f'{prefix}_{column}'] = embedded_field[column]
+                            if is_undefined:
                                 num_undefined += 1
-                                have_undefined = False
                     elif k == 'extended_fields':
                         for i in range(len(v)):
                             alldata[f'{k}_{i}'] = v[i]
                     else:
-                        if k == "id":
-                            alldata["embedded_map_id"] = v
-                        elif k == "contributor":
-                            alldata["contributor_id"] = v
-                        else:
-                            alldata[k] = v
+                        alldata[k] = v
                 data = alldata
                 self._result = {"code": 0, "message": f"{r.status_code}"}
                 self._error = False
             else:
-                self._raw_data = []
+                self._last_response = None
                 data = []
                 self._result = {"code": -1, "message": f"{r.status_code}"}
                 self._error = True
         except Exception as e:
-            self._raw_data = []
+            self._last_response = None
             self._result = {"code": -1, "message": str(e)}
             self._error = True
             return
 
         return data
 
-    def _flatten_facilities_json(self, json_data: dict) -> dict:
-        """Convert deep facility data to a flat key,value dict.
+    def _facilities_parameters(self, q: str = "", contributors: Union[int, list] = -1, lists: int = -1,
+                               contributor_types: Union[str, list] = "", countries: str = "",
+                               boundary: dict = {}, parent_company: str = "", facility_type: str = "",
+                               processing_type: str = "", product_type: str = "", number_of_workers: str = "",
+                               native_language_name: str = "", detail: bool = False, sectors: str = "",
+                               page: int = -1, pageSize: int = -1) -> list:
+        """Build the query parameters of a ``GET /api/facilities/`` request as a list of (key, value) tuples.
 
         Internal use only.
         """
-        base_entry = {}
-        for k, v in json_data.items():
-            if k == "matches":
+        parameters = []
+
+        if page != -1:
+            parameters.append(("page", page))
+        if pageSize != -1:
+            parameters.append(("pageSize", pageSize))
+        if len(q) > 0:
+            parameters.append(("q", q))
+        if contributors != -1:
+            if isinstance(contributors, list):
+                for contributor in contributors:
+                    parameters.append(("contributors", contributor))
+            else:
+                parameters.append(("contributors", contributors))
+        if lists != -1:
+            parameters.append(("lists", lists))
+        if len(contributor_types) > 0:
+            if isinstance(contributor_types, list):
+                for contributor_type in contributor_types:
+                    parameters.append(("contributor_types", contributor_type))
+            else:
+                parameters.append(("contributor_types", contributor_types))
+        if len(countries) > 0:
+            parameters.append(("countries", countries))
+        if len(boundary.keys()) > 0:
+            parameters.append(("boundary", _json_dumps(boundary)))
+        if len(parent_company) > 0:
+            parameters.append(("parent_company", parent_company))
+        if len(facility_type) > 0:
+            parameters.append(("facility_type", facility_type))
+        if len(processing_type) > 0:
+            parameters.append(("processing_type", processing_type))
+        if len(product_type) > 0:
+            parameters.append(("product_type", product_type))
+        if len(number_of_workers) > 0:
+            parameters.append(("number_of_workers", number_of_workers))
+        if len(native_language_name) > 0:
+            parameters.append(("native_language_name", native_language_name))
+        if detail:
+            parameters.append(("detail", "true"))
+        else:
+            parameters.append(("detail", "false"))
+        if len(sectors) > 0:
+            parameters.append(("sectors", sectors))
+
+        return parameters
+
+    async def get_facilities_async(self, q: str = "",
+                                   contributors: Union[int, list] = -1,
+                                   lists: int = -1,
+                                   contributor_types: Union[str, list] = "",
+                                   countries: str = "",
+                                   boundary: dict = {}, parent_company: str = "", facility_type: str = "",
+                                   processing_type: str = "", product_type: str = "", number_of_workers: str = "",
+                                   native_language_name: str = "", detail: bool = False, sectors: str = "",
+                                   page: int = -1, pageSize: int = -1, concurrency: int = 8) -> list:
+        """Asynchronous version of :py:meth:`~pyoshub.OSH_API.get_facilities`, fetching result pages concurrently.
+
+        The first page is requested to learn the total result count, all remaining pages are then requested
+        in parallel, at most ``concurrency`` at a time. Requires the optional
+        `httpx <https://www.python-httpx.org/>`_ package.
+
+        .. code-block:: py
+
+            facilities = asyncio.run(osh_api.get_facilities_async(countries="CH"))
+
+        Parameters
+        ----------
+        concurrency : int, optional, default = 8
+           Maximum number of requests in flight at the same time. Keep this low to stay within rate limits.
+
+        All other parameters are the same as for :py:meth:`~pyoshub.OSH_API.get_facilities`.
+
+        Returns
+        -------
+        list(dict)
+            Same as :py:meth:`~pyoshub.OSH_API.get_facilities`.
+        """
+        alldata = []
+        self._last_response = None
+        if httpx is None:
+            self._result = {"code": -1, "message": "get_facilities_async requires the httpx package"}
+            self._error = True
+            return alldata
+
+        parameters = self._facilities_parameters(
+            q=q, contributors=contributors, lists=lists, contributor_types=contributor_types, countries=countries,
+            boundary=boundary, parent_company=parent_company, facility_type=facility_type,
+            processing_type=processing_type, product_type=product_type, number_of_workers=number_of_workers,
+            native_language_name=native_language_name, detail=detail, sectors=sectors,
+            page=page, pageSize=pageSize)
+        request_url = self._facilities_url
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(client, page_parameters: list):
+            async with semaphore:
+                epoch, start = time.time(), time.perf_counter_ns()
+                r = _HttpxResponse(await client.get(request_url, params=page_parameters))
+                self._record_call(epoch, start)
+                return r
+
+        try:
+            limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+            async with httpx.AsyncClient(headers=self._header, limits=limits, timeout=30.0) as client:
+                responses = [await fetch(client, parameters)]
+                if responses[0].ok:
+                    data = _json_loads(responses[0].content)
+                    if data.get("next") is not None and len(data["features"]) > 0:
+                        # pages are numbered from 1, the page size is whatever the server returned
+                        first_page = page if page != -1 else 1
+                        last_page = math.ceil(data["count"]/len(data["features"]))
+                        base_parameters = [(k, v) for k, v in parameters if k != "page"]
+                        responses += await asyncio.gather(*[fetch(client, base_parameters+[("page", p)])
+                                                            for p in range(first_page+1, last_page+1)])
+
+            for r in responses:
+                self._set_last_response(r)
+                if not r.ok:
+                    self._result = {"code": -1, "message": f"{r.status_code}"}
+                    self._error = True
+                    return alldata
+                self._features_to_entries(_json_loads(r.content)["features"], alldata)
+            self._result = {"code": 0, "message": f"{r.status_code}"}
+            self._error = False
+        except Exception as e:
+            self._result = {"code": -1, "message": str(e)}
+            self._error = True
+
+        return alldata
+
+    def _flatten_match_response(self, data: dict) -> dict:
+        """Flatten the response of a match confirm/reject call, ``matched_facility`` attributes are returned
+        with a ``matched_`` prefix.
+
+        Internal use only.
+        """
+        new_data = {}
+        for k, v in data.items():
+            handler = _MATCH_HANDLERS.get(k)
+            if handler is not None:
+                handler(new_data, v)
+            elif isinstance(v, (dict, list)) or k in _SKIP_KEYS or k.startswith(_SKIP_PREFIXES):
                 continue
-            elif k == "geocoded_geometry":
-                try:
-                    base_entry["lon"] = v["coordinates"][0]
-                    base_entry["lat"] = v["coordinates"][1]
-                except Exception:
-                    base_entry["lon"] = -1
-                    base_entry["lat"] = -1
             else:
-                if v is not None:
-                    base_entry[k] = v
+                new_data[k] = v
+        return new_data
+
+    def _get_facilities_stream(self, parameters: list, alldata: Union[list, dict],
+                               add_features) -> Union[list, dict]:
+        """Streaming variant of :py:meth:`~pyoshub.OSH_API.get_facilities`, pages are parsed with ijson
+        while being downloaded and passed to ``add_features`` to be collected in ``alldata``.
+
+        Internal use only.
+        """
+        if ijson is None:
+            self._result = {"code": -1, "message": "stream=True requires the ijson package"}
+            self._error = True
+            return alldata
+
+        request_url = self._facilities_url
+        while request_url is not None:
+            try:
+                r = self._get_timed(request_url, params=parameters, stream=True)
+                self._set_last_response(r)
+                if r.ok:
+                    r.raw.decode_content = True
+                    fields = {"next": None}
+                    add_features(_ijson_items(r.raw, "features.item", fields), alldata)
+                    # the next URL comes with the query already encoded
+                    request_url = fields["next"]
+                    parameters = None
+                    self._result = {"code": 0, "message": f"{r.status_code}"}
+                    self._error = False
                 else:
-                    base_entry[k] = ""
+                    request_url = None
+                    self._result = {"code": -1, "message": f"{r.status_code}"}
+                    self._error = True
+            except Exception as e:
+                self._result = {"code": -1, "message": str(e)}
+                self._error = True
+                return alldata
+
+        return alldata
 
+    def _get_facilities_downloads_stream(self, as_dataframe: bool = False) -> list:
+        """Streaming variant of :py:meth:`~pyoshub.OSH_API.get_facilities_downloads`, pages are parsed with
+        ijson while being downloaded.
+
+        Internal use only.
+        """
         alldata = []
-        if len(json_data["matches"]) > 0:
-            match_no = 1
-            for match in json_data["matches"]:
-                new_data = {"match_no": match_no}
-                new_data.update(base_entry)
-                for k, v in match.items():
-                    if isinstance(v, list):
-                        raise NotImplementedError("Internal _flatten_facilities_json. Facilities data structure must have changed. "
-                                                  "Instance 1/2. "
-                                                  "Please report on github and/or check for an updated library.")
-                        pass
-                    elif k in ["Feature", "type"]:
-                        pass
-                    elif k == "geometry":
-                        new_data["match_lon"] = v["coordinates"][0]
-                        new_data["match_lat"] = v["coordinates"][1]
-                    elif isinstance(v, dict):
-                        for kk, vv in v.items():
-                            if isinstance(vv, list):
-                                if len(vv) == 0:
-                                    new_data[f"match_{kk}"] = ""
-                                else:
-                                    lines = []
-                                    for vvv in vv:
-                                        if isinstance(vvv, dict):
-                                            lines.append("|".join([f"{kkkk}:{vvvv}" for kkkk, vvvv in vvv.items()]))
-                                        elif isinstance(vvv, str):
-                                            lines.append(vvv)
-                                    new_data[f"match_{kk}"] = "\n".join(lines).replace("lng:", "lon:")
-                            elif isinstance(vv, dict):
-                                for kkk, vvv in vv.items():
-                                    lines = []
-                                    if isinstance(vvv, str):
-                                        lines = [vvv]
-                                    else:
-                                        for entry in vvv:
-                                            if isinstance(entry, dict):
-                                                lines.append("|".join([f"{kkkk}:{vvvv}" for kkkk, vvvv in entry.items()]))
-                                            else:
-                                                raise NotImplementedError("Internal _flatten_facilities_json. Facilities data structure must have changed. "
-                                                                          "Instance 2/2. "
-                                                                          "Please report on github and/or check for an updated library.")
-                                    new_data[f"match_{kk}_{kkk}"] = "\n".join(lines).replace("lng:", "lon:")
-                                pass
-                            elif kk.startswith("ppe_"):
-                                continue
-                            else:
-                                new_data[f"match_{kk}"] = "" if vv is None else vv
-                        pass
-                    else:
-                        new_data[f"match_{k}"] = "" if v is None else v
+        if ijson is None:
+            self._result = {"code": -1, "message": "stream=True requires the ijson package"}
+            self._error = True
+            return alldata
 
-                # shorten names of dictionary keys
-                new_data_keys_shortened = {}
-                for k, v in new_data.items():
-                    if "match_extended_fields_" in k:
-                        new_data_keys_shortened[k.replace("match_extended_fields_", "match_ef_")] = v
+        request_url = self._facilities_downloads_url
+        headers = []
+        while request_url is not None:
+            try:
+                r = self._get_timed(request_url, stream=True)
+                self._set_last_response(r)
+                if r.ok:
+                    r.raw.decode_content = True
+                    fields = {"next": None, "results.headers": None}
+                    pending = []  # rows arriving before the headers
+                    for row in _ijson_items(r.raw, "results.rows.item", fields):
+                        if as_dataframe or fields["results.headers"] is None:
+                            pending.append(row)
+                        else:
+                            alldata.append(dict(zip(fields["results.headers"], row)))
+                    headers = fields["results.headers"] or headers
+                    if as_dataframe:
+                        alldata.extend(pending)
                     else:
-                        new_data_keys_shortened[k] = v
+                        alldata.extend([dict(zip(headers, row)) for row in pending])
+                    request_url = fields["next"]
+                    self._result = {"code": 0, "message": f"{r.status_code}"}
+                    self._error = False
+                else:
+                    request_url = None
+                    self._result = {"code": -1, "message": f"{r.status_code}"}
+                    self._error = True
+            except Exception as e:
+                self._result = {"code": -1, "message": str(e)}
+                self._error = True
+                break
 
-                alldata.append(new_data_keys_shortened)
-                match_no += 1
+        return _rows_to_dataframe(headers, alldata) if as_dataframe else alldata
+
+    def _features_to_entries(self, features, alldata: list) -> list:
+        """Convert GeoJSON facility features to flat dicts, appending them to ``alldata``.
+
+        Internal use only.
+        """
+        # the page is built in one comprehension and added with a single extend() call, so the result list
+        # grows once per page; the key slice is cheaper than a str.startswith() call on these short keys,
+        # and plain string comparisons beat any re.match() equivalent here, so keep this regex free
+        skip_key = "new_os_id"
+        alldata.extend([
+            {"os_id": entry["id"],
+             "lon": entry["geometry"]["coordinates"][0],
+             "lat": entry["geometry"]["coordinates"][1],
+             **{k: v for k, v in entry["properties"].items() if k[:4] != "ppe_" and k != skip_key}}
+            for entry in features
+        ])
+        return alldata
+
+    def _features_to_columns(self, features, columns: dict) -> dict:
+        """Convert GeoJSON facility features to columns, a dict with one list per field, adding them to
+        ``columns``. Fields missing in a feature are padded with None so all lists keep the same length.
+
+        Internal use only.
+        """
+        skip_key = "new_os_id"
+        rows = len(columns["os_id"]) if "os_id" in columns else 0
+        for entry in features:
+            coordinates = entry["geometry"]["coordinates"]
+            row = {"os_id": entry["id"], "lon": coordinates[0], "lat": coordinates[1]}
+            row.update({k: v for k, v in entry["properties"].items() if k[:4] != "ppe_" and k != skip_key})
+            for k, v in row.items():
+                column = columns.get(k)
+                if column is None:
+                    column = columns[k] = [None]*rows
+                column.append(v)
+            rows += 1
+            if len(row) < len(columns):
+                for column in columns.values():
+                    if len(column) < rows:
+                        column.append(None)
+        return columns
+
+    def _request(self, method: str, url: str, parse: bool = True, **kwargs) -> tuple:
+        """Issue a request, update the API call statistics and result, and parse the JSON answer.
+
+        Returns a ``(data, ok)`` pair, ``data`` is ``None`` unless the call succeeded. With ``parse=False``
+        the undecoded body is returned instead.
+
+        Internal use only, safe to call from worker threads.
+        """
+        r = self._send(method, url, **kwargs)
+        if r is None:
+            return None, False
+        return self._parse(r, parse)
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Issue a request and update the API call statistics. Returns ``None``, with the error result set,
+        if the request raised.
+
+        Internal use only, safe to call from worker threads.
+        """
+        try:
+            epoch, start = time.time(), time.perf_counter_ns()
+            r = self._session.request(method, url, **kwargs)
+        except Exception as e:
+            self._result = {"code": -1, "message": str(e)}
+            self._error = True
+            return None
+        self._set_last_response(r)
+        self._record_call(epoch, start)
+        return r
+
+    def _record_call(self, epoch: float, start: int):
+        """Update the API call statistics for a call made at wall clock time ``epoch``, ``start`` being
+        :py:func:`time.perf_counter_ns` at that moment, which measures the duration more precisely.
+
+        Internal use only, safe to call from worker threads.
+        """
+        duration = (time.perf_counter_ns()-start)/1e9
+        with self._lock:
+            self.last_api_call_epoch = epoch
+            self.last_api_call_duration = duration
+            self._api_call_count += 1
+
+    def _parse(self, r, parse: bool = True) -> tuple:
+        """Set the result from a response and return its ``(data, ok)`` pair, see
+        :py:meth:`~pyoshub.OSH_API._request`.
+
+        Internal use only.
+        """
+        if not r.ok:
+            self._result = {"code": -1, "message": f"{r.status_code}"}
+            self._error = True
+            return None, False
+        try:
+            # answers parsed here are at most a few hundred entries, one bulk parse of the bytes is much faster
+            # than a streaming parser like ijson, which only pays off for the paginated facilities download
+            data = _json_loads(r.content) if parse else r.content
+        except Exception as e:
+            self._result = {"code": -1, "message": str(e)}
+            self._error = True
+            return None, False
+
+        self._result = {"code": 0, "message": f"{r.status_code}"}
+        self._error = False
+        return data, True
+
+    def _cached_get(self, url: str, ttl: int, parse: bool = True) -> tuple:
+        """Like a GET through :py:meth:`~pyoshub.OSH_API._request`, but answers are remembered per URL for
+        ``ttl`` seconds. Once expired, the endpoint is asked with the answer's ETag, and a ``304 Not Modified``
+        keeps the remembered data for another ``ttl`` seconds without parsing anything. If the request raises
+        or fails with a server error and ``cache_fallback_enabled`` is set, expired data is returned with a
+        ``stale`` result message.
+
+        Internal use only.
+        """
+        entry = self._response_cache.get(url)  # (expires, etag, data)
+        if entry is not None and time.time() < entry[0]:
+            self._result = {"code": 0, "message": "cached"}
+            self._error = False
+            return entry[2], True
+
+        headers = {"If-None-Match": entry[1]} if entry is not None and entry[1] else {}
+        r = self._send("GET", url, headers=headers)
+        if (r is None or r.status_code >= 500) and entry is not None and self.cache_fallback_enabled:
+            logging.warning("%s failed, returning stale data", url)
+            self._result = {"code": 0, "message": "stale"}
+            self._error = False
+            return entry[2], True
+        if r is None:
+            return None, False
+        if r.status_code == 304 and entry is not None:
+            self._response_cache[url] = (time.time()+ttl, entry[1], entry[2])
+            self._result = {"code": 0, "message": f"{r.status_code}"}
+            self._error = False
+            return entry[2], True
+        data, ok = self._parse(r, parse)
+        if ok:
+            self._response_cache[url] = (time.time()+ttl, r.headers.get("ETag"), data)
+        return data, ok
+
+    def _get_count(self, url: str, default=-1, ttl: int = 0):
+        """GET an endpoint answering ``{"count": N}`` and return N, or ``default`` if the call failed or the
+        answer holds no count. The number is read straight from the body, without a JSON parse. With a
+        ``ttl`` the answer is remembered, see :py:meth:`~pyoshub.OSH_API._cached_get`.
+
+        Internal use only.
+        """
+        if ttl > 0:
+            content, ok = self._cached_get(url, ttl, parse=False)
         else:
-            alldata.append(base_entry)
+            content, ok = self._request("GET", url, parse=False)
+        if not ok:
+            return default
+        m = _COUNT_RE.search(content)
+        if m:
+            return int(m[1])
+        try:
+            return int(_json_loads(content)["count"])
+        except Exception as e:  # e.g. an HTML maintenance page
+            self._response_cache.pop(url, None)
+            self._result = {"code": -1, "message": str(e)}
+            self._error = True
+            return default
+
+    def _get_timed(self, url: str, **kwargs) -> requests.Response:
+        """Issue a GET request and update the API call statistics.
+
+        Internal use only, safe to call from worker threads.
+        """
+        epoch, start = time.time(), time.perf_counter_ns()
+        r = self._session.get(url, **kwargs)
+        self._record_call(epoch, start)
+        return r
+
+    def _flatten_facilities_json(self, json_data: dict) -> dict:
+        """Convert deep facility data to a flat key,value dict.
+
+        Internal use only.
+        """
+        # a plain loop rather than a comprehension, lon/lat take the place of geocoded_geometry in the column order
+        base_entry = {}
+        for k, v in json_data.items():
+            if k == "geocoded_geometry":
+                try:
+                    base_entry["lon"], base_entry["lat"] = v["coordinates"][0], v["coordinates"][1]
+                except Exception:
+                    base_entry["lon"] = base_entry["lat"] = -1
+            elif k != "matches":
+                base_entry[k] = "" if v is None else v
+
+        if not json_data["matches"]:
+            return [base_entry]
+
+        alldata = []
+        for match_no, match in enumerate(json_data["matches"], 1):
+            new_data = {"match_no": match_no, **base_entry}
+            for k, v in match.items():
+                if isinstance(v, list):
+                    raise NotImplementedError("Internal _flatten_facilities_json. Facilities data structure must have changed. "
+                                              "Instance 1/2. "
+                                              "Please report on github and/or check for an updated library.")
+                    pass
+                elif k in ["Feature", "type"]:
+                    pass
+                elif k == "geometry":
+                    new_data["match_lon"] = v["coordinates"][0]
+                    new_data["match_lat"] = v["coordinates"][1]
+                elif isinstance(v, dict):
+                    for kk, vv in v.items():
+                        # one type() lookup instead of a chain of isinstance() checks per property; only
+                        # scalar ppe_ properties are dropped, lists and dicts are flattened like the others
+                        handler = _MATCH_PROPERTY_HANDLERS.get(type(vv))
+                        if handler is not None:
+                            handler(new_data, kk, vv)
+                        elif kk[:4] != "ppe_":
+                            new_data["match_" + kk] = "" if vv is None else vv
+                else:
+                    new_data[f"match_{k}"] = "" if v is None else v
+
+            alldata.append(new_data)
 
         return alldata
@@ -0,0 +1,23 @@
+import pytest
+import pyoshub.pyoshub as pyoshub
+import warnings
+
+httpx = pytest.importorskip("httpx")
+
+
+class Test__HttpxSession:
+    def test__HttpxSession_post_bytes(self):
+        sent = {}
+
+        def handler(request):
+            sent["body"] = request.content
+            return httpx.Response(201, json={"ok": True})
+
+        session = pyoshub._HttpxSession(http2=False)
+        session._client = httpx.Client(transport=httpx.MockTransport(handler))
+        with warnings.catch_warnings():
+            # pre-encoded bodies are handed to httpx as content=, data= bytes is deprecated there
+            warnings.simplefilter("error", DeprecationWarning)
+            r = session.post("https://osh.example/api/facilities/", data=b"name=A+b&country=DE")
+        assert (r.status_code == 201)
+        assert (sent["body"] == b"name=A+b&country=DE")
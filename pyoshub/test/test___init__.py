@@ -21,24 +21,30 @@ def vcr_config():
 @pytest.mark.vcr()
 class Test___init__:
     def test_invalid_protocol(self):
-        osh_api = pyoshub.OSH_API(url="invalid://will_raise_exception")
+        osh_api = pyoshub.OSH_API(url="invalid://will_raise_exception", check_url=True)
         assert (osh_api.result == {'code': -1, 'message': "No connection adapters were found for 'invalid://will_raise_exception/health-check/'"})
         assert (osh_api.error)
         assert (not osh_api.ok)
         assert (osh_api.reason == "No connection adapters were found for 'invalid://will_raise_exception/health-check/'")
 
     def test_invalid_url(self):
-        osh_api = pyoshub.OSH_API(url="https://doesnot.ex.ist")
+        osh_api = pyoshub.OSH_API(url="https://doesnot.ex.ist", check_url=True)
         assert (osh_api.result["code"] == -1)
         assert ("Max retries exceeded with url: /health-check/" in osh_api.result["message"])
         assert (osh_api.error)
 
     def test_valid_url(self):
-        osh_api = pyoshub.OSH_API(url=os.environ["TEST_OSH_URL"])
+        osh_api = pyoshub.OSH_API(url=os.environ["TEST_OSH_URL"], check_url=True)
         assert (osh_api.result["code"] == 0)
         assert (osh_api.result["message"] == "ok")
         assert (not osh_api.error)
 
+    def test_no_url_check(self):
+        osh_api = pyoshub.OSH_API(url="https://doesnot.ex.ist")
+        assert (osh_api.result == {"code": 0, "message": "ok"})
+        assert (not osh_api.error)
+        assert (osh_api.api_call_count == 0)
+
     def test_valid_url_no_token_test_token(self):
         osh_api = pyoshub.OSH_API(url=os.environ["TEST_OSH_URL"], check_token=True)
         assert (osh_api.result["code"] == -1)
@@ -46,7 +52,7 @@ class Test___init__:
         assert (osh_api.error)
 
     def test_valid_url_invalid_token(self):
-        osh_api = pyoshub.OSH_API(url=os.environ["TEST_OSH_URL"], token="invalid")
+        osh_api = pyoshub.OSH_API(url=os.environ["TEST_OSH_URL"], token="invalid", check_url=True)
         assert (osh_api.result["code"] == 0)
         assert (osh_api.result["message"] == "ok")
         assert (not osh_api.error)
@@ -142,3 +148,17 @@ class Test___init__:
         assert (osh_api.result["code"] == 0)
         assert (osh_api.result["message"] == "ok")
         assert (not osh_api.error)
+
+    def test_raw_data(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        assert (osh_api.get_countries_active_count() == 157)
+        assert (osh_api.raw_data == '{"count":157}')
+        osh_api.keep_raw_data(False)
+        assert (osh_api.raw_data == "")
+        assert (osh_api.get_countries_active_count() == 158)
+        assert (osh_api.raw_data == "")
+        osh_api.keep_raw_data()
+        assert (osh_api.get_countries_active_count() == 159)
+        assert (osh_api.raw_data == '{"count":159}')
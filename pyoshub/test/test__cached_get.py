@@ -0,0 +1,79 @@
+import pytest
+import pyoshub.pyoshub as pyoshub
+import requests
+from unittest import mock
+
+URL = "https://osh.example/api/contributors"
+
+
+def _response(status: int, body: bytes = b"", headers: dict = {}) -> requests.Response:
+    r = requests.Response()
+    r.status_code = status
+    r._content = body
+    r.headers.update(headers)
+    return r
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pyoshub.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def osh_api():
+    osh_api = pyoshub.OSH_API(url="https://osh.example", token="dummy")
+    osh_api._session = mock.Mock()
+    return osh_api
+
+
+class Test__cached_get:
+    def test__cached_get_fresh_hit(self, osh_api, clock):
+        osh_api._session.request.side_effect = [_response(200, b'[[1, "A"]]', {"ETag": '"v1"'})]
+        assert (osh_api._cached_get(URL, 60) == ([[1, "A"]], True))
+        clock[0] += 59
+        assert (osh_api._cached_get(URL, 60) == ([[1, "A"]], True))
+        assert (osh_api.result == {"code": 0, "message": "cached"})
+        assert (osh_api._session.request.call_count == 1)
+
+    def test__cached_get_revalidate_not_modified(self, osh_api, clock):
+        osh_api._session.request.side_effect = [
+            _response(200, b'[[1, "A"]]', {"ETag": '"v1"'}),
+            _response(304),
+        ]
+        osh_api._cached_get(URL, 60)
+        clock[0] += 61
+        assert (osh_api._cached_get(URL, 60) == ([[1, "A"]], True))
+        assert (osh_api.result == {"code": 0, "message": "304"})
+        assert (osh_api._session.request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'})
+        # the 304 keeps the data for another ttl
+        clock[0] += 59
+        osh_api._cached_get(URL, 60)
+        assert (osh_api._session.request.call_count == 2)
+
+    def test__cached_get_expired(self, osh_api, clock):
+        osh_api._session.request.side_effect = [
+            _response(200, b'[[1, "A"]]'),
+            _response(200, b'[[1, "A"], [2, "B"]]'),
+        ]
+        osh_api._cached_get(URL, 60)
+        clock[0] += 61
+        assert (osh_api._cached_get(URL, 60) == ([[1, "A"], [2, "B"]], True))
+        # without an ETag the endpoint is asked unconditionally
+        assert (osh_api._session.request.call_args.kwargs["headers"] == {})
+        assert (osh_api.result == {"code": 0, "message": "200"})
+
+    def test__cached_get_stale_on_server_error(self, osh_api, clock):
+        osh_api._session.request.side_effect = [
+            _response(200, b'[[1, "A"]]', {"ETag": '"v1"'}),
+            _response(503),
+            _response(503),
+        ]
+        osh_api._cached_get(URL, 60)
+        clock[0] += 61
+        assert (osh_api._cached_get(URL, 60) == (None, False))
+        assert (osh_api.result == {"code": -1, "message": "503"})
+        osh_api.cache_fallback_enabled = True
+        assert (osh_api._cached_get(URL, 60) == ([[1, "A"]], True))
+        assert (osh_api.result == {"code": 0, "message": "stale"})
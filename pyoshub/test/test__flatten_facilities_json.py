@@ -399,3 +399,69 @@ class Test__flatten_facilities_json:
         result = osh_api._flatten_facilities_json(before)
         assert (result == after)
         assert (len(result) == 2)
+
+    def test__flatten_facilities_json_ppe_properties(self):
+        before = {
+            "matches": [
+                {
+                    "id": "DE2022278H70901",
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [10.9134482, 48.3829797]},
+                    "properties": {
+                        "name": "Somename",
+                        "ppe_product_types": ["Masks", "Gloves"],
+                        "ppe_contact_phone": None,
+                        "ppe_website": "https://example.com",
+                        "country_code": "DE",
+                    },
+                    "confidence": 0.9,
+                },
+            ],
+            "item_id": 804345,
+            "status": "MATCHED",
+        }
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"],
+            check_token=False)
+        result = osh_api._flatten_facilities_json(before)
+        # scalar ppe_ properties are dropped, lists are flattened like any other property
+        assert (list(result[0].items()) == [
+            ("match_no", 1),
+            ("item_id", 804345),
+            ("status", "MATCHED"),
+            ("match_id", "DE2022278H70901"),
+            ("match_lon", 10.9134482),
+            ("match_lat", 48.3829797),
+            ("match_name", "Somename"),
+            ("match_ppe_product_types", "Masks\nGloves"),
+            ("match_country_code", "DE"),
+            ("match_confidence", 0.9),
+        ])
+
+    def test__flatten_facilities_json_key_order(self):
+        before = {
+            "matches": [],
+            "item_id": 804344,
+            "geocoded_geometry": {"type": "Point", "coordinates": [-75.5658153, 6.2476376]},
+            "geocoded_address": "Medellín, Medellin, Antioquia, Colombia",
+            "status": "NEW_FACILITY",
+            "os_id": None,
+        }
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"],
+            check_token=False)
+        result = osh_api._flatten_facilities_json(before)
+        # lon and lat take the place of geocoded_geometry
+        assert (list(result[0].items()) == [
+            ("item_id", 804344),
+            ("lon", -75.5658153),
+            ("lat", 6.2476376),
+            ("geocoded_address", "Medellín, Medellin, Antioquia, Colombia"),
+            ("status", "NEW_FACILITY"),
+            ("os_id", ""),
+        ])
+        result = osh_api._flatten_facilities_json(dict(before, geocoded_geometry=None))
+        assert (result[0]["lon"] == -1)
+        assert (result[0]["lat"] == -1)
@@ -31,6 +31,12 @@ class Test_get_contributor_lists:
         assert ("list_id" in result[0].keys())
         assert ("list_name" in result[0].keys())
         assert (osh_api.ok)
+        result = osh_api.get_contributor_lists(25, flat=True)
+        assert (result == [
+            (1562, 'Levi Strauss & Co. Factory List Q1 2022'),
+            (1563, 'Levi Strauss & Co. Mill List Q1 2022')
+        ])
+        assert (osh_api.contributors == result)
 
     def test_get_contributor_lists_invalid(self):
         osh_api = pyoshub.OSH_API(
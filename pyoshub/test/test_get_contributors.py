@@ -27,3 +27,8 @@ class Test_get_contributors:
         assert (len(result) == 476)
         assert ('contributor_id' in result[0].keys())
         assert ('contributor_name' in result[0].keys())
+        assert (osh_api.contributors == result)
+        # answered from the cache, the contributors property follows the flat form
+        flat = osh_api.get_contributors(flat=True)
+        assert (flat[0] == (result[0]["contributor_id"], result[0]["contributor_name"]))
+        assert (osh_api.contributors == flat)
@@ -38,6 +38,17 @@ class Test_get_facilities:
         )
         assert (len(result) == 82)
 
+    def test_get_facilities_country_CH_columns(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"],
+            check_token=True)
+        result = osh_api.get_facilities(countries="CH", return_shape="columns")
+        assert (list(result.keys())[:3] == ['os_id', 'lon', 'lat'])
+        assert (result["os_id"][0] == 'CH2022234TE4H2S')
+        assert (result["name"][0] == 'AGEMEAT AND TRADING AG')
+        assert (all(len(column) == 82 for column in result.values()))
+
     def test_get_facilities_query_light(self):
         osh_api = pyoshub.OSH_API(
             url=os.environ["TEST_OSH_URL"],
@@ -26,3 +26,12 @@ class Test_get_facilities:
             check_token=True)
         result = osh_api.get_facilities_count()
         assert (result == 109371)
+
+    def test_get_facilities_count_not_json(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        result = osh_api.get_facilities_count()
+        assert (result == -1)
+        assert (osh_api.error)
+        assert (osh_api.result["code"] == -1)
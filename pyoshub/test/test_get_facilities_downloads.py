@@ -0,0 +1,55 @@
+import pytest
+import pyoshub.pyoshub as pyoshub
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@pytest.fixture(scope='module')
+def vcr_config():
+    return {
+        # Replace the Authorization request header with "DUMMY" in cassettes
+        "filter_headers": [
+            ('authorization', 'HIDDEN')],
+        "record_mode": 'new'
+    }
+
+
+@pytest.mark.vcr()
+class Test_get_facilities_downloads:
+    def test_page_urls_page(self):
+        result = pyoshub._page_urls("https://osh.example/api/facilities-downloads/?page=2&pageSize=50", 120, 50)
+        assert (result == [
+            "https://osh.example/api/facilities-downloads/?page=2&pageSize=50",
+            "https://osh.example/api/facilities-downloads/?page=3&pageSize=50",
+        ])
+
+    def test_page_urls_offset_limit(self):
+        result = pyoshub._page_urls("https://osh.example/api/facilities-downloads/?limit=50&offset=50", 120, 50)
+        assert (result == [
+            "https://osh.example/api/facilities-downloads/?limit=50&offset=50",
+            "https://osh.example/api/facilities-downloads/?limit=50&offset=100",
+        ])
+
+    def test_page_urls_missing_count(self):
+        assert (pyoshub._page_urls("https://osh.example/api/facilities-downloads/?page=2", None, 50) == [])
+
+    def test_page_urls_non_numeric_count(self):
+        assert (pyoshub._page_urls("https://osh.example/api/facilities-downloads/?page=2", "many", 50) == [])
+
+    def test_get_facilities_downloads_pages(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        result = osh_api.get_facilities_downloads()
+        assert (osh_api.ok)
+        assert (osh_api.api_call_count == 3)
+        assert ([r["os_id"] for r in result] == [
+            "DE2022278H70901",
+            "DE2022278H70902",
+            "DE2022278H70903",
+            "DE2022278H70904",
+            "DE2022278H70905",
+        ])
+        assert (result[0] == {"os_id": "DE2022278H70901", "name": "Facility 1", "country_code": "DE"})
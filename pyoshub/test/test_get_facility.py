@@ -59,3 +59,20 @@ class Test_get_facility:
         assert (not osh_api.ok)
         assert (osh_api.status_code == -1)
         assert (osh_api.reason == "404")
+
+    def test_get_facilities_by_id(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"],
+            check_token=True)
+        count = osh_api.api_call_count
+        result = osh_api.get_facilities_by_id(
+            ["CN2021250D1DTN7", "inexistant", "DE20211253G9MQX", "CN2021250D1DTN7"], max_workers=3)
+        assert (len(result) == 4)
+        assert (result[0]["id"] == "CN2021250D1DTN7")
+        assert (result[0]["name"] == 'Shanghai knitwear factory')
+        assert (result[1] == {})
+        assert (result[2]["id"] == "DE20211253G9MQX")
+        assert (result[2]["name"] == 'Footwear studios')
+        assert (result[3] == result[0])
+        assert (osh_api.api_call_count == count + 3)
@@ -1,6 +1,7 @@
 import pytest
 import pyoshub.pyoshub as pyoshub
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -95,3 +96,39 @@ class Test_get_sectors:
             {'sector': 'Textiles'},
             {'sector': 'Tier 2'},
             {'sector': 'Toys'}])
+
+    def test_get_sectors_cached(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"],
+            check_token=True)
+        result = osh_api.get_sectors()
+        count = osh_api.api_call_count
+        assert (osh_api.get_sectors() == result)
+        assert (osh_api.api_call_count == count)
+        osh_api.invalidate_cache()
+        assert (osh_api.get_sectors() == result)
+        assert (osh_api.api_call_count == count + 1)
+
+    def test_get_sectors_flat(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"],
+            check_token=True)
+        result = osh_api.get_sectors(flat=True)
+        assert (len(result) == 69)
+        assert (result[:3] == ['"Bed ""', '"Bed"', '"Knit Bottoms"'])
+        assert (result[-1] == 'Toys')
+        assert (osh_api.get_sectors() == [{'sector': sector} for sector in result])
+
+    def test_get_sectors_rate_limited(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        start = time.time()
+        result = osh_api.get_sectors()
+        # a throttled GET is reported right away, not retried after the Retry-After window
+        assert (time.time()-start < 2)
+        assert (osh_api.error)
+        assert (osh_api.result["message"] == "429")
+        assert (result == [])
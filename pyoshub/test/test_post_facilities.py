@@ -18,6 +18,8 @@ def vcr_config():
 
 @pytest.mark.vcr()
 class Test_post_facilities_match:
+    # the upload body must be byte for byte what the server was sent when the cassette was recorded
+    @pytest.mark.vcr(match_on=["method", "scheme", "host", "port", "path", "query", "body"])
     def test_post_facilities_new(self):
         osh_api = pyoshub.OSH_API(
             url=os.environ["TEST_OSH_URL"],
@@ -311,3 +313,35 @@ class Test_post_facilities_match:
         assert (result['status'] == 'TIMEOUT')
         assert (osh_api.result["code"] == -2)
         assert ('429 Exceeded timeout after' in osh_api.result['message'])
+
+    def test_post_facilities_rate_limit_without_wait_time(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        result = osh_api.post_facilities(
+            name="Another new facility",
+            country="Algeria",
+            address="Zone Industrielle BP 14",
+            sector="Food"
+        )
+        assert (result == {'status': 'ERROR'})
+        assert (osh_api.result["code"] == -1)
+        assert (osh_api.result["message"] == "429 Unexpected: Could not detect timeout value, aborting")
+
+    def test_post_facility_matches_bulk(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        result = osh_api.post_facility_matches_bulk([
+            ("/api/facility-matches/699466/confirm/", True),
+            ("/api/facility-matches/699490/reject/", False),
+            (699491, True),
+        ])
+        assert (osh_api.api_call_count == 3)
+        assert (len(result) == 3)
+        assert (result[0]["id"] == 804349)
+        assert (result[0]["matched_os_id"] == "CN2020016QWVKKG")
+        assert (result[0]["status"] == "CONFIRMED_MATCH")
+        assert (result[1]["id"] == 804412)
+        assert (result[1]["matched_os_id"] == "LS2022296W4Q8H6")
+        assert (result[2] == {"status": "HTTP_ERROR"})
@@ -96,7 +96,7 @@ class Test_post_facilities_bulk:
             [
                 {
                     "name": "This could be, a new facility",
-                    "address": "Cl 29 No. 37-02 MARINILLA, , Medell\u00edn",
+                    "address": "Cl 29 No. 37-02 MARINILLA, Medell\u00edn",
                     "sector": "Construction",
                     "diagnosis": "MISSING column(s) country",
                     "cleansed": True
@@ -140,3 +140,100 @@ class Test_post_facilities_bulk:
                     "cleansed": True
                 }
             ])
+
+    def test_post_facilities_bulk_duplicate_records(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        record = {
+            "name":"Some Test Facility",
+            "address":"1F Jln 2/38 Seksyen 2 Petaling Jaya, N/A, Selangor ,",
+            "sector":"Construction",
+            "country":"Malaysia",
+        }
+        result = osh_api.post_facilities_bulk([record, dict(record, name="SOME TEST FACILITY")], cleanse = True)
+        assert (osh_api.api_call_count == 1)
+        assert (len(result) == 2)
+        assert (result[0]["os_id"] == "MY2022297H0MC6N")
+        assert (result[1]["os_id"] == "MY2022297H0MC6N")
+        assert (result[1]["name"] == "SOME TEST FACILITY")
+        result = osh_api.post_facilities_bulk([record], cleanse = True)
+        assert (osh_api.api_call_count == 1)
+        assert (result[0]["os_id"] == "MY2022297H0MC6N")
+
+    def test_post_facilities_bulk_server_error(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        result = osh_api.post_facilities_bulk(
+            [
+                {
+                    "name":"Some Test Facility",
+                    "address":"1F Jln 2/38 Seksyen 2 Petaling Jaya, Selangor",
+                    "country":"Malaysia",
+                },
+            ],
+        )
+        assert (result ==
+            [
+                {
+                    "name": "Some Test Facility",
+                    "address": "1F Jln 2/38 Seksyen 2 Petaling Jaya, Selangor",
+                    "country": "Malaysia",
+                    "diagnosis": "VALID",
+                    "status": "ERROR",
+                    "cleansed": False
+                }
+            ])
+        assert (osh_api.result["message"] == "400 Bad Request")
+
+    def test_post_facilities_bulk_df_same_as_bulk(self):
+        pandas = pytest.importorskip("pandas")
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        records = [
+            {
+                "name":"Some Test Facility",
+                "address":"1F Jln 2/38 Seksyen 2 Petaling Jaya, N/A, Selangor ,",
+                "sector":"Construction",
+                "country":"Malaysia",
+            },
+            {
+                "name":"Another Test Facility",
+                "address":"Jalan Kemajuan, Petaling Jaya",
+                "sector":"Construction",
+                "country":"Malaysia",
+            },
+            {
+                "name":"Facility  without country",
+                "address":"N/A, Selangor",
+                "sector":"Construction",
+            },
+        ]
+        result = osh_api.post_facilities_bulk(records, cleanse=True, max_workers=1)
+        osh_api.clear_match_cache()
+        result_df = osh_api.post_facilities_bulk_df(pandas.DataFrame(records), cleanse=True, max_workers=1)
+        assert (osh_api.api_call_count == 4)
+        assert (result_df == result)
+        assert ([r["cleansed"] for r in result_df] == [True, False, True])
+        assert ([r["os_id"] for r in result_df[:2]] == ["MY2022297H0MC6N", "MY2022297J2KD4M"])
+        assert (result_df[0]["address"] == "1F Jln 2/38 Seksyen 2 Petaling Jaya, Selangor")
+        assert (result_df[2]["diagnosis"] == "MISSING column(s) country")
+
+    def test_post_facilities_bulk_timeout(self):
+        osh_api = pyoshub.OSH_API(
+            url=os.environ["TEST_OSH_URL"],
+            token=os.environ["TEST_OSH_TOKEN"])
+        result = osh_api.post_facilities_bulk(
+            [
+                {
+                    "name":"Some Test Facility",
+                    "address":"1F Jln 2/38 Seksyen 2 Petaling Jaya, Selangor",
+                    "country":"Malaysia",
+                },
+            ],
+            timeout=0,
+        )
+        assert (result[0]["status"] == "TIMEOUT")
+        assert ("called with: 0 s" in osh_api.result["message"])
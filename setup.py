@@ -16,4 +16,11 @@ setup(
        "pytest",
        "pyyaml",
    ],
+   extras_require={
+       "orjson": ["orjson"],
+       "ijson": ["ijson"],
+       "http2": ["httpx[http2]"],
+       "async": ["httpx"],
+       "cache": ["requests-cache"],
+   },
 )